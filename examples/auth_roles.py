@@ -5,6 +5,8 @@ from genro_routes.exceptions import NotAuthenticated, NotAuthorized
 
 
 class SecureService(RoutingClass):
+    __slots__ = ()
+
     def __init__(self):
         # We plug the 'auth' plugin to enable role-based access control
         self.route.plug("auth")
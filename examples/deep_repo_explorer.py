@@ -3,29 +3,68 @@ from __future__ import annotations
 import importlib.util
 import inspect
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from types import FunctionType, ModuleType
 
 from genro_routes import Router, RoutingClass, Section
 
+# Executed modules by (realpath, mtime_ns): a file is imported once per
+# process until it changes on disk. Failed imports are cached as None.
+_MODULE_CACHE: dict[tuple[str, int], ModuleType | None] = {}
+
+
+@cache
+def _public_callables(cls: type) -> tuple[str, ...]:
+    """Public method names of ``cls``, classified once per class.
+
+    ``getattr_static`` reads the raw class attribute without running
+    descriptors, so mapping the same class again skips introspection.
+    """
+    return tuple(
+        name
+        for name in dir(cls)
+        if not name.startswith("_")
+        and isinstance(
+            inspect.getattr_static(cls, name, None), (FunctionType, classmethod, staticmethod)
+        )
+    )
+
+
+@cache
+def _source_realpath(filename: str) -> str | None:
+    """Resolved path of a ``co_filename``, looked up once per file.
+
+    Synthetic names such as ``<string>`` have no file behind them.
+    """
+    if not filename or filename.startswith("<"):
+        return None
+    return os.path.realpath(filename)
+
 
 class MagicClassRouter(RoutingClass):
     """Maps all public methods of a class as routes."""
+
+    __slots__ = ("_cls",)
+
     def __init__(self, cls: type):
         self._cls = cls
 
         # We need an instance to bind methods, or we treat them as static
         # For a "repo explorer", we might just map the signatures
-        for attr_name in dir(cls):
-            if attr_name.startswith("_"):
-                continue
-            attr = getattr(cls, attr_name)
-            if inspect.isfunction(attr) or inspect.ismethod(attr):
-                self.route.add_entry(attr, name=attr_name)
+        self.route.add_entries(
+            (attr_name, getattr(cls, attr_name)) for attr_name in _public_callables(cls)
+        )
 
 class PythonModuleService(RoutingClass):
     """Exposes internal functions and classes of a Python module as routes."""
+
+    __slots__ = ("file_path", "_file_realpath", "_module_name", "_module")
+
     def __init__(self, name: str, file_path: str):
         self.route.plug("pydantic")
         self.file_path = os.path.abspath(file_path)
+        self._file_realpath = os.path.realpath(self.file_path)
         self._module_name = name
         self._module = self._import_file(name, file_path)
 
@@ -33,64 +72,93 @@ class PythonModuleService(RoutingClass):
             self._map_contents()
 
     def _import_file(self, name: str, path: str):
+        try:
+            key = (os.path.realpath(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            return None
+        if key in _MODULE_CACHE:
+            return _MODULE_CACHE[key]
+        module = None
         try:
             spec = importlib.util.spec_from_file_location(name, path)
             if spec and spec.loader:
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
-                return module
         except Exception:
-            return None
-        return None
+            module = None
+        _MODULE_CACHE[key] = module
+        return module
 
     def _map_contents(self):
         """Introspects the module and adds its contents as entries."""
-        for attr_name in dir(self._module):
+        for attr_name, attr in self._module.__dict__.items():
             if attr_name.startswith("_"):
                 continue
-            attr = getattr(self._module, attr_name)
+            # Re-exports from other modules are dropped here, before any
+            # inspection work is spent on them.
+            if getattr(attr, "__module__", None) != self._module_name:
+                continue
 
             if inspect.isfunction(attr):
                 # Check if function is defined in this file
-                try:
-                    attr_file = inspect.getsourcefile(attr)
-                    if attr_file and os.path.samefile(os.path.abspath(attr_file), self.file_path):
-                        self.route.add_entry(attr, name=attr_name)
-                except (TypeError, ValueError, OSError):
-                    pass
-            elif inspect.isclass(attr) and getattr(attr, "__module__", None) == self._module_name:
-                # Class belongs to this module via __module__
+                code = getattr(attr, "__code__", None)
+                if code is not None and _source_realpath(code.co_filename) == self._file_realpath:
+                    self.route.add_entry(attr, name=attr_name)
+            elif inspect.isclass(attr):
                 self.route.include(MagicClassRouter(attr).route, name=attr_name)
 
 class CodeInspector(RoutingClass):
     """Orchestrates the discovery of Python modules as functional routers."""
+
+    __slots__ = ("root",)
+
     def __init__(self, root_path: str):
         self.root = os.path.abspath(root_path)
         self.route.description = "Repository inspector"
-        self._discover_modules(self.route, self.root, depth=1)
-
-    def _discover_modules(self, parent_router: Router, current_path: str, depth: int):
+        # Loading a module is mostly file I/O (stat, read, compile), so the
+        # loads run on a thread pool while the walk continues. Routers are
+        # linked into the tree only from this thread.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            self._discover_modules(self.route, self.root, depth=1, executor=executor)
+
+    def _discover_modules(
+        self,
+        parent_router: Router,
+        current_path: str,
+        depth: int,
+        *,
+        executor: ThreadPoolExecutor,
+    ):
         if depth < 0:
             return
 
+        # scandir exposes the entry type read with the directory listing, so
+        # classifying an entry costs no extra stat() call.
         try:
-            items = os.listdir(current_path)
+            entries = os.scandir(current_path)
         except PermissionError:
             return
 
-        for item in items:
-            if item.startswith('.') or item == "__pycache__":
-                continue
-            full_path = os.path.join(current_path, item)
+        pending: list[tuple[str, Future[PythonModuleService]]] = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or name == "__pycache__":
+                    continue
+
+                if entry.is_dir(follow_symlinks=False):
+                    section = Section()
+                    parent_router.include(section.route, name=name)
+                    self._discover_modules(
+                        section.route, entry.path, depth - 1, executor=executor
+                    )
 
-            if os.path.isdir(full_path):
-                section = Section()
-                parent_router.include(section.route, name=item)
-                self._discover_modules(section.route, full_path, depth - 1)
+                elif name.endswith('.py'):
+                    future = executor.submit(PythonModuleService, name[:-3], entry.path)
+                    pending.append((name[:-3], future))
 
-            elif item.endswith('.py'):
-                module_service = PythonModuleService(item[:-3], full_path)
-                parent_router.include(module_service.route, name=item[:-3])
+        for module_name, future in pending:
+            parent_router.include(future.result().route, name=module_name)
 
 if __name__ == "__main__":
     # Explore the mcp_bridge example folder
@@ -118,6 +186,6 @@ if __name__ == "__main__":
             print(f" - Methods in GenroMCPBridge: {methods}")
 
     print("\n--- Summary ---")
-    print("Fixed: Using os.path.samefile() for robust path comparison.")
+    print("Fixed: Comparing resolved source paths for robust file matching.")
     print("Fixed: Now introspecting Classes as sub-routers.")
     print("Fixed: LLM/MCP can now see every class and method in the repository.")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+from types import FunctionType
 from typing import Any
 
 from faker import Faker
@@ -11,27 +12,70 @@ from genro_routes import RoutingClass
 # MAGIC Wrapper: Automatically maps all methods of an object as routes
 # -----------------------------------------------------------------------------
 
+_PUBLIC_CALLABLES: dict[tuple[type, ...], tuple[str, ...]] = {}
+
+
+def _public_callables(obj: Any) -> tuple[str, ...]:
+    """Public method names of ``obj``, classified once per provider layout.
+
+    Faker binds provider methods on the generator instance rather than on a
+    class, so the cache key is the object's type plus its provider classes:
+    two Faker instances with the same providers share one classification.
+    """
+    providers = getattr(obj, "providers", None)
+    key = (type(obj), *(type(p) for p in providers or ()))
+    names = _PUBLIC_CALLABLES.get(key)
+    if names is None:
+        if providers:
+            names = _provider_methods(providers)
+        else:
+            names = tuple(
+                name
+                for name in dir(obj)
+                if not name.startswith("_")
+                and (inspect.ismethod(attr := getattr(obj, name)) or inspect.isfunction(attr))
+            )
+        _PUBLIC_CALLABLES[key] = names
+    return names
+
+
+def _provider_methods(providers: list[Any]) -> tuple[str, ...]:
+    """Generator names declared by Faker providers, read from class dicts.
+
+    Only the provider classes are scanned (not every attribute of the
+    generator), and nothing is fetched or bound while classifying.
+    """
+    seen: dict[str, None] = {}
+    for provider in providers:
+        for cls in type(provider).__mro__[:-1]:  # skip object
+            for name, value in vars(cls).items():
+                if not name.startswith("_") and isinstance(value, FunctionType):
+                    seen.setdefault(name)
+    return tuple(seen)
+
+
 class MagicFakerRouter(RoutingClass):
+    __slots__ = ("_provider",)
+
     def __init__(self, provider_obj: Any):
         self.route.plug("pydantic")
         self._provider = provider_obj
 
         # Magic introspection: map all public methods of the provider
-        for attr_name in dir(provider_obj):
-            if attr_name.startswith("_"):
-                continue
-
-            attr = getattr(provider_obj, attr_name)
-            if inspect.ismethod(attr) or inspect.isfunction(attr):
-                # Dynamically register the entry in the router
-                # This is the core of genro-routes' power
-                self.route.add_entry(attr, name=attr_name)
+        # Dynamically register the entries in the router, in one batch
+        # This is the core of genro-routes' power
+        self.route.add_entries(
+            (attr_name, getattr(provider_obj, attr_name))
+            for attr_name in _public_callables(provider_obj)
+        )
 
 # -----------------------------------------------------------------------------
 # Service exposing ALL of Faker hierarchically
 # -----------------------------------------------------------------------------
 
 class FullFakerService(RoutingClass):
+    __slots__ = ("fake", "person", "address", "company")
+
     def __init__(self, locale: str = "en_US"):
         self.fake = Faker(locale=locale)
 
@@ -10,6 +10,8 @@ from genro_routes import RoutingClass, route
 
 # 1. Define the Services (Tools for the LLM)
 class MathService(RoutingClass):
+    __slots__ = ()
+
     def __init__(self):
         self.route.plug("pydantic")
 
@@ -26,6 +28,8 @@ class MathService(RoutingClass):
         return a * b
 
 class RootApp(RoutingClass):
+    __slots__ = ("math",)
+
     def __init__(self):
         self.math = MathService()
         self.add_branches({"name": "math", "instance": self.math})
@@ -42,12 +46,14 @@ def run_agent_demo():
     app = RootApp()
     bridge = GenroMCPBridge(app.route)
 
-    # Get tools from Genro-Routes
-    mcp_tools = bridge.get_mcp_tools()
-
-    # Standardize names for the LLM (internal mapping)
-    # MCP bridge uses underscores for tool names, we need to map them back to /
-    tool_map = {t['name']: t['name'].replace("_", "/") for t in mcp_tools}
+    # Map the flat tool names the LLM sees back to Genro paths: the bridge
+    # keeps the original path of each tool, so nothing is re-derived here
+    tool_map = bridge.get_tool_paths()
+    # Resolve every tool to its RouterNode once: a node is reusable, so each
+    # tool_use block below is a dict lookup plus a call, not a path walk.
+    resolved = {name: app.route.node(path) for name, path in tool_map.items()}
+    # The tool payload is constant for the whole session: build it once.
+    anthropic_tools = bridge.get_anthropic_tools()
 
     print("--- LLM Agent Simulation via Genro-Routes ---")
     prompt = "Add 15 and 27, then multiply the result by 2. Tell me the final answer."
@@ -57,11 +63,7 @@ def run_agent_demo():
     message = client.messages.create(
         model="claude-3-5-sonnet-20240620",
         max_tokens=1024,
-        tools=[{
-            "name": t['name'],
-            "description": t['description'],
-            "input_schema": t['inputSchema']
-        } for t in mcp_tools],
+        tools=anthropic_tools,
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -83,7 +85,7 @@ def run_agent_demo():
                 genro_path = tool_map[tool_name]
                 print(f"[AGENT] Calling {genro_path} with {tool_input}")
 
-                result = app.route.node(genro_path)(**tool_input)
+                result = resolved[tool_name](**tool_input)
 
                 tool_results.append({
                     "type": "tool_result",
@@ -96,11 +98,7 @@ def run_agent_demo():
         message = client.messages.create(
             model="claude-3-5-sonnet-20240620",
             max_tokens=1024,
-            tools=[{
-                "name": t['name'],
-                "description": t['description'],
-                "input_schema": t['inputSchema']
-            } for t in mcp_tools],
+            tools=anthropic_tools,
             messages=current_messages
         )
 
@@ -1,60 +1,192 @@
 from __future__ import annotations
 
+import json
+from collections import deque
 from typing import Any
 
 from genro_routes import Router
 
+# Shared read-only fallback for missing node blocks; never mutated.
+_EMPTY: dict[str, Any] = {}
+
+# Description for entries without a docstring, shared by every such tool.
+_NO_DESC = "No description provided"
+
+# Input schema for entries without a params block, shared by every such tool
+# in the cached lists. Callers only ever receive copies (see _copy_tools).
+_NO_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "description": "No parameter schema available",
+}
+
+
+def _copy_tools(tools: list[dict[str, Any]], schema_key: str) -> list[dict[str, Any]]:
+    """Copy ``tools`` one level deep, plus each tool's input schema dict."""
+    return [{**tool, schema_key: dict(tool[schema_key])} for tool in tools]
+
 
 class GenroMCPBridge:
-    """Helper to bridge Genro-Routes to Model Context Protocol (MCP)."""
+    """Helper to bridge Genro-Routes to Model Context Protocol (MCP).
+
+    Harvested tools are cached against the ``revision`` of every router the
+    listing walked, so repeated listings (e.g. one per agent turn) skip the
+    tree walk until one of those routers actually changes. Recording each
+    router, not just the root, keeps the cache valid for routers linked in
+    by a secondary ``include()``, whose changes do not reach the root.
+
+    Trees with the ``env`` plugin are never cached: their visibility depends
+    on capabilities evaluated at listing time, which no revision tracks.
+
+    The list getters return a fresh list of fresh tool dicts on every call,
+    with their top-level input schema copied too, so a caller editing its
+    result cannot corrupt later listings. Nested schema dicts come straight
+    from the routers' node metadata and must be treated as read-only.
+    """
 
     def __init__(self, router: Router):
         self.router = router
+        self._tools_cache: list[dict[str, Any]] | None = None
+        self._anthropic_cache: list[dict[str, Any]] | None = None
+        self._tools_json: bytes | None = None
+        self._tool_paths: dict[str, str] = {}
+        self._watched: tuple[Router, ...] = ()
+        self._watched_revs: tuple[int, ...] = ()
 
     def get_mcp_tools(self) -> list[dict[str, Any]]:
         """Returns a list of tools formatted for the Model Context Protocol."""
+        return _copy_tools(self._tools(), "inputSchema")
+
+    def _tools(self) -> list[dict[str, Any]]:
+        """Return the (possibly cached) tool list; never hand it out as is."""
+        if self._tools_cache is not None and self._watched_revs == tuple(
+            r.revision for r in self._watched
+        ):
+            return self._tools_cache
         # We use the internal introspection to harvest all entries
         nodes = self.router.nodes()
-        return self._harvest_tools(nodes)
+        tools, self._tool_paths = self._harvest_tools(nodes)
+        self._anthropic_cache = None
+        self._tools_json = None
+        watched = self._watched_routers(nodes)
+        if watched is None:
+            self._tools_cache = None
+            self._watched, self._watched_revs = (), ()
+            return tools
+        self._tools_cache = tools
+        # Read revisions after nodes(): lazy binding bumps them on first use.
+        self._watched = watched
+        self._watched_revs = tuple(r.revision for r in watched)
+        return tools
 
-    def _harvest_tools(self, nodes: dict[str, Any], path_prefix: str = "") -> list[dict[str, Any]]:
-        tools = []
+    def get_tool_paths(self) -> dict[str, str]:
+        """Map each flat tool name back to its original router path.
 
-        # Process entries in the current node
-        entries = nodes.get("entries", {})
-        for name, info in entries.items():
-            tool_name = f"{path_prefix}{name}"
+        Kept on the bridge rather than in the tool definitions, so the
+        tools/list payload carries only MCP schema fields.
+        """
+        self._tools()
+        return dict(self._tool_paths)
 
-            # Build MCP tool definition. Both schemas come from the neutral
-            # node blocks (params/result), fetched once by genro-routes; the
-            # bridge never re-inspects the handler callable.
-            tool = {
-                "name": tool_name.replace("/", "_"), # MCP likes flat names with underscores
-                "description": info.get("doc", "No description provided"),
-                "inputSchema": self._input_schema(info),
-            }
+    def get_anthropic_tools(self) -> list[dict[str, Any]]:
+        """Returns the tools reshaped for the Anthropic Messages API."""
+        tools = self._tools()
+        if self._anthropic_cache is None:
+            anthropic = [
+                {
+                    "name": t["name"],
+                    "description": t["description"],
+                    "input_schema": t["inputSchema"],
+                }
+                for t in tools
+            ]
+            if self._tools_cache is None:
+                return anthropic
+            self._anthropic_cache = anthropic
+        return _copy_tools(self._anthropic_cache, "input_schema")
 
-            # Add response schema if available
-            output_schema = (info.get("result") or {}).get("schema")
-            if output_schema:
-                tool["outputSchema"] = output_schema
+    def get_mcp_tools_json(self) -> bytes:
+        """Returns the MCP tool list serialized as UTF-8 JSON.
 
-            tools.append(tool)
+        Encoded once per cached tool list, so a server answering repeated
+        ``tools/list`` requests can write the same buffer every time.
+        """
+        tools = self._tools()
+        if self._tools_json is None:
+            encoded = json.dumps(tools, separators=(",", ":")).encode()
+            if self._tools_cache is None:
+                return encoded
+            self._tools_json = encoded
+        return self._tools_json
 
-        # Recurse into child routers
-        routers = nodes.get("routers", {})
-        for r_name, r_nodes in routers.items():
-            tools.extend(self._harvest_tools(r_nodes, f"{path_prefix}{r_name}/"))
+    def _watched_routers(self, nodes: dict[str, Any]) -> tuple[Router, ...] | None:
+        """Collect the routers described by ``nodes``; None if any filters on env."""
+        watched: list[Router] = []
+        stack = [nodes]
+        while stack:
+            current = stack.pop()
+            if "env" in (current.get("plugin_info") or _EMPTY):
+                return None
+            router = current.get("router")
+            if router is not None:
+                watched.append(router)
+            stack.extend((current.get("routers") or _EMPTY).values())
+        return tuple(watched)
 
-        return tools
+    def _harvest_tools(
+        self, nodes: dict[str, Any], path_prefix: str = ""
+    ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        tools: list[dict[str, Any]] = []
+        # Flat tool name -> router path, so callers map a tool back to its
+        # node without reversing the "/" -> "_" flattening.
+        paths: dict[str, str] = {}
+        # Iterative pre-order walk: children are pushed reversed so they are
+        # visited in declaration order, as a recursive walk would.
+        # Each level carries both the router path prefix and its flattened
+        # form (MCP likes flat names with underscores), so per-entry names
+        # are a single concatenation.
+        stack: deque[tuple[dict[str, Any], str, str]] = deque(
+            [(nodes, path_prefix, path_prefix.replace("/", "_"))]
+        )
+        while stack:
+            current, prefix, flat_prefix = stack.pop()
+
+            # Process entries in the current node
+            for name, info in (current.get("entries") or _EMPTY).items():
+                flat_name = flat_prefix + name
+                paths[flat_name] = prefix + name
+
+                # Build MCP tool definition. Both schemas come from the neutral
+                # node blocks (params/result), fetched once by genro-routes; the
+                # bridge never re-inspects the handler callable.
+                tool = {
+                    "name": flat_name,
+                    "description": info.get("doc") or _NO_DESC,
+                    "inputSchema": self._input_schema(info),
+                }
+
+                # Add response schema if available
+                output_schema = (info.get("result") or _EMPTY).get("schema")
+                if output_schema:
+                    tool["outputSchema"] = output_schema
+
+                tools.append(tool)
+
+            # Queue child routers
+            routers = current.get("routers") or _EMPTY
+            stack.extend(
+                (r_nodes, f"{prefix}{r_name}/", f"{flat_prefix}{r_name}_")
+                for r_name, r_nodes in reversed(routers.items())
+            )
+
+        return tools, paths
 
     def _input_schema(self, info: dict[str, Any]) -> dict[str, Any]:
-        """Extract the input JSON Schema from the neutral params block."""
-        schema = (info.get("params") or {}).get("schema")
-        if schema:
-            return schema
-        return {
-            "type": "object",
-            "properties": {},
-            "description": "No parameter schema available"
-        }
+        """Extract the input JSON Schema from the neutral params block.
+
+        The schema itself is built once per handler by the pydantic plugin at
+        decoration time, so this is a plain lookup. Entries without one share
+        the module-level ``_NO_SCHEMA`` dict.
+        """
+        schema = (info.get("params") or _EMPTY).get("schema")
+        return schema or _NO_SCHEMA
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pygments import highlight
 from pygments.formatters import HtmlFormatter, TerminalFormatter
+from pygments.lexer import Lexer
 from pygments.lexers import get_lexer_by_name
 
 from genro_routes import RoutingClass, route
@@ -10,23 +11,35 @@ from genro_routes import RoutingClass, route
 class HighlightingService(RoutingClass):
     """Wraps the Pygments library to provide syntax highlighting as a service."""
 
+    __slots__ = ("_lexers", "_html_formatters", "_terminal_formatter")
+
     def __init__(self):
         # We use Pydantic for robust input validation of code and options
         self.route.plug("pydantic")
+        # Lexers and formatters are stateless between highlight() calls:
+        # build them once instead of on every request.
+        self._lexers: dict[str, Lexer] = {}
+        self._html_formatters = {
+            False: HtmlFormatter(linenos=False),
+            True: HtmlFormatter(linenos=True),
+        }
+        self._terminal_formatter = TerminalFormatter()
+
+    def _lexer(self, language: str) -> Lexer:
+        lexer = self._lexers.get(language)
+        if lexer is None:
+            lexer = self._lexers[language] = get_lexer_by_name(language)
+        return lexer
 
     @route()
     def html(self, code: str, language: str = "python", linenos: bool = False) -> str:
         """Generates HTML highlighted code."""
-        lexer = get_lexer_by_name(language)
-        formatter = HtmlFormatter(linenos=linenos)
-        return highlight(code, lexer, formatter)
+        return highlight(code, self._lexer(language), self._html_formatters[bool(linenos)])
 
     @route()
     def terminal(self, code: str, language: str = "python") -> str:
         """Generates ANSI terminal highlighted code."""
-        lexer = get_lexer_by_name(language)
-        formatter = TerminalFormatter()
-        return highlight(code, lexer, formatter)
+        return highlight(code, self._lexer(language), self._terminal_formatter)
 
 if __name__ == "__main__":
     service = HighlightingService()
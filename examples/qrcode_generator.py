@@ -14,6 +14,8 @@ from genro_routes import RoutingClass, route
 class QRCodeService(RoutingClass):
     """Wraps the qrcode library to generate QR code assets."""
 
+    __slots__ = ()
+
     def __init__(self):
         self.route.plug("pydantic")
 
@@ -23,6 +25,8 @@ class QRCodeService(RoutingClass):
         if qrcode is None:
             return "Error: 'qrcode' library not installed. Run 'pip install qrcode[pil]'"
 
+        # A fresh builder per call: QRCode accumulates data and grows its
+        # version in make(), so a shared one is unsafe under concurrent calls.
         qr = qrcode.QRCode(version=1, box_size=box_size, border=border)
         qr.add_data(data)
         qr.make(fit=True)
@@ -31,7 +35,8 @@ class QRCodeService(RoutingClass):
 
         buffered = io.BytesIO()
         img.save(buffered, format="PNG")
-        return base64.b64encode(buffered.getvalue()).decode()
+        # getbuffer() is a zero-copy view; base64 output is pure ASCII
+        return base64.b64encode(buffered.getbuffer()).decode("ascii")
 
 if __name__ == "__main__":
     service = QRCodeService()
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 import os
+import stat
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from genro_routes import RoutingClass, route
 
 
+@lru_cache(maxsize=1024)
+def _normalized_join(root: str, path: str) -> str:
+    """Join ``path`` onto ``root`` and collapse ``.``/``..`` segments.
+
+    Pure string work, cached because agents keep asking for the same paths.
+    """
+    return os.path.normpath(os.path.join(root, path))
+
+
 class RepositoryService(RoutingClass):
     """
     Exposes a repository as a Service.
@@ -14,25 +26,34 @@ class RepositoryService(RoutingClass):
     we provide methods that take paths as arguments.
     """
 
+    __slots__ = ("root", "_root_sep")
+
     def __init__(self, root_path: str):
         self.root = os.path.abspath(root_path)
+        # Root with a trailing separator: "/repo_evil" must not pass for "/repo"
+        self._root_sep = os.path.join(self.root, "")
         # Use Pydantic for path validation
         self.route.plug("pydantic")
 
     @route()
-    def list_dir(self, path: str = ".") -> list[str]:
-        """Lists files and directories in a given path."""
+    def list_dir(self, path: str = ".", limit: int = 1000, offset: int = 0) -> list[str]:
+        """Lists files and directories in a given path, one page at a time."""
         target = self._secure_path(path)
-        return os.listdir(target)
+        # scandir is consumed lazily: the listing stops once the page is full.
+        with os.scandir(target) as entries:
+            return [entry.name for entry in islice(entries, offset, offset + limit)]
 
     @route()
-    def read_file(self, path: str) -> str:
-        """Reads the content of a file."""
+    def read_file(self, path: str, max_bytes: int = 65536) -> str:
+        """Reads the content of a file, up to ``max_bytes`` bytes."""
         target = self._secure_path(path)
         if not os.path.isfile(target):
             raise ValueError(f"Path is not a file: {path}")
-        with open(target, encoding='utf-8', errors='ignore') as f:
-            return f.read()
+        # One bounded binary read and a single decode: large files never
+        # get loaded whole just to preview them.
+        with open(target, 'rb') as f:
+            data = f.read(max_bytes)
+        return data.decode('utf-8', errors='ignore')
 
     @route()
     def get_info(self, path: str) -> dict[str, Any]:
@@ -42,14 +63,14 @@ class RepositoryService(RoutingClass):
         return {
             "name": os.path.basename(path),
             "size": stats.st_size,
-            "is_dir": os.path.isdir(target),
+            "is_dir": stat.S_ISDIR(stats.st_mode),
             "mtime": stats.st_mtime
         }
 
     def _secure_path(self, path: str) -> str:
         """Ensures the path stays within the root directory."""
-        full_path = os.path.abspath(os.path.join(self.root, path))
-        if not full_path.startswith(self.root):
+        full_path = _normalized_join(self.root, path)
+        if full_path != self.root and not full_path.startswith(self._root_sep):
             raise PermissionError("Access outside root directory is denied")
         return full_path
 
@@ -11,18 +11,22 @@ from genro_routes import RoutingClass
 
 class MagicRouter(RoutingClass):
     """Dynamically maps any Python object's public methods into a router."""
+
+    __slots__ = ("_target",)
+
     def __init__(self, target: Any):
         self._target = target
 
         # Introspection: collect all public methods
+        entries = []
         for attr_name in dir(target):
             if attr_name.startswith("_"):
                 continue
 
             attr = getattr(target, attr_name)
             if inspect.ismethod(attr) or inspect.isfunction(attr):
-                # Dynamically register the entry
-                self.route.add_entry(attr, name=attr_name)
+                entries.append((attr_name, attr))
+        self.route.add_entries(entries)
 
 # -----------------------------------------------------------------------------
 # 2. Self-Documentation Service
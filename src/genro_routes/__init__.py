@@ -17,9 +17,11 @@ Public exports:
     - Exceptions: ``NotFound``, ``NotAuthorized``, ``NotAuthenticated``,
       ``NotAvailable``
 
-Plugin registration happens lazily via ``import_module`` to avoid cycles.
-Built-in plugins (logging, pydantic, auth, env, channel) are
-auto-registered on first import. Dialect layers (OpenAPI, MCP) live in the
+Exports are resolved lazily (PEP 562): ``import genro_routes`` only reads the
+version, and each name is imported from its submodule on first access, then
+cached in the module namespace. Built-in plugins (logging, pydantic, auth, env,
+channel) are auto-registered by ``genro_routes.core.router`` the first time
+the plugin registry is used. Dialect layers (OpenAPI, MCP) live in the
 transport packages (e.g. genro-asgi) and read the neutral ``nodes()`` output.
 
 Example::
@@ -32,44 +34,42 @@ Example::
             return "Hello, World!"
 """
 
-from importlib import import_module
 from importlib.metadata import version as get_version
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
 
 __version__ = get_version("genro-routes")
 
-from .core import (
-    Router,
-    RouterInterface,
-    RoutingClass,
-    RoutingContext,
-    Section,
-    is_result_wrapper,
-    route,
-)
-from .core.router_node import RouterNode
-from .exceptions import (
-    NotAuthenticated,
-    NotAuthorized,
-    NotAvailable,
-    NotFound,
-)
+if TYPE_CHECKING:  # pragma: no cover - static view of the lazy exports
+    from .core.context import RoutingContext as RoutingContext
+    from .core.decorators import route as route
+    from .core.router import Router as Router
+    from .core.router_interface import RouterInterface as RouterInterface
+    from .core.router_node import RouterNode as RouterNode
+    from .core.routing import RoutingClass as RoutingClass
+    from .core.routing import Section as Section
+    from .core.routing import is_result_wrapper as is_result_wrapper
+    from .exceptions import NotAuthenticated as NotAuthenticated
+    from .exceptions import NotAuthorized as NotAuthorized
+    from .exceptions import NotAvailable as NotAvailable
+    from .exceptions import NotFound as NotFound
 
-# Import plugins to trigger auto-registration (lazy to avoid cycles)
-for _plugin in ("logging", "pydantic", "auth", "env", "channel"):
-    import_module(f"{__name__}.plugins.{_plugin}")
-del _plugin
+# Single source of truth for the public API: (name, defining submodule).
+# ``__all__`` and the lazy resolver are both derived from it.
+_EXPORTS: tuple[tuple[str, str], ...] = (
+    ("Router", ".core.router"),
+    ("RouterInterface", ".core.router_interface"),
+    ("RouterNode", ".core.router_node"),
+    ("RoutingClass", ".core.routing"),
+    ("RoutingContext", ".core.context"),
+    ("Section", ".core.routing"),
+    ("is_result_wrapper", ".core.routing"),
+    ("route", ".core.decorators"),
+    ("NotFound", ".exceptions"),
+    ("NotAuthorized", ".exceptions"),
+    ("NotAuthenticated", ".exceptions"),
+    ("NotAvailable", ".exceptions"),
+)
 
-__all__ = [
-    "Router",
-    "RouterInterface",
-    "RouterNode",
-    "RoutingClass",
-    "RoutingContext",
-    "Section",
-    "is_result_wrapper",
-    "route",
-    "NotFound",
-    "NotAuthorized",
-    "NotAuthenticated",
-    "NotAvailable",
-]
+__all__, __getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
@@ -0,0 +1,51 @@
+# Copyright 2025 Softwell S.r.l.
+# Licensed under the Apache License, Version 2.0
+
+"""Lazy (PEP 562) exports shared by the package ``__init__`` modules.
+
+A package declares its public API once, as ``(name, defining submodule)``
+pairs, and gets back ``__all__``, ``__getattr__`` and ``__dir__``::
+
+    __all__, __getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+Each export is imported from its submodule on first access, then cached in
+the package namespace so later lookups skip ``__getattr__``. Names outside
+the table fall back to the submodule of the same name, as a regular package
+would resolve them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+__all__ = ["lazy_exports"]
+
+
+def lazy_exports(
+    package: str,
+    namespace: dict[str, Any],
+    exports: tuple[tuple[str, str], ...],
+) -> tuple[tuple[str, ...], Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``(__all__, __getattr__, __dir__)`` for ``package`` from ``exports``."""
+    lazy = dict(exports)
+    names = tuple(name for name, _ in exports)
+
+    def __getattr__(name: str) -> Any:
+        module = lazy.get(name)
+        if module is None:
+            try:
+                return import_module(f".{name}", package)
+            except ModuleNotFoundError as exc:
+                if exc.name != f"{package}.{name}":
+                    raise
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value  # later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(names))
+
+    return names, __getattr__, __dir__
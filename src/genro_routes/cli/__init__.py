@@ -18,7 +18,7 @@ from genro_routes.core.routing import RoutingClass
 
 from ._builder import CliBuilder
 
-__all__ = ["RoutingCli"]
+__all__ = ("RoutingCli",)
 
 
 class RoutingCli:
@@ -4,14 +4,14 @@
 import asyncio
 import enum
 import inspect
-from typing import Any, get_type_hints
+from typing import Any
 
 import click
 
 from genro_routes.core.routing import RoutingClass
 
 from ._formatters import OutputFormatter
-from ._type_map import ParamConverter
+from ._type_map import ParamConverter, param_hints
 
 
 def _cli_name(name: str) -> str:
@@ -58,10 +58,11 @@ class CliBuilder:
         """Create a click.Command from a single entry."""
         handler = entry_info["callable"]
         doc = entry_info.get("doc", "")
-        params = self._converter.to_click_params(handler)
+        hints = param_hints(handler)
+        params = self._converter.to_click_params(handler, hints)
         is_async = inspect.iscoroutinefunction(handler)
         formatter = self._formatter
-        enum_params = self._enum_param_map(handler)
+        enum_params = self._enum_param_map(hints)
 
         def callback(**kwargs: Any) -> None:
             # Convert enum string values back to enum members
@@ -81,13 +82,8 @@ class CliBuilder:
             help=doc,
         )
 
-    def _enum_param_map(self, handler: Any) -> dict[str, type[enum.Enum]]:
+    def _enum_param_map(self, hints: dict[str, Any]) -> dict[str, type[enum.Enum]]:
         """Return {param_name: EnumType} for parameters annotated with an Enum."""
-        try:
-            hints = get_type_hints(handler, include_extras=True)
-        except Exception:
-            return {}
-        hints.pop("return", None)
         return {
             name: hint
             for name, hint in hints.items()
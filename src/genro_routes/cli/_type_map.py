@@ -4,10 +4,12 @@
 import enum
 import inspect
 import json
-from typing import Any, Literal, Union, get_args, get_origin
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
 
 import click
 
+from genro_routes.core.router_node import _HINT_ERRORS
+
 # Direct mapping: Python type → click.ParamType
 _SIMPLE_MAP: dict[type, click.ParamType] = {
     str: click.STRING,
@@ -17,24 +19,36 @@ _SIMPLE_MAP: dict[type, click.ParamType] = {
 }
 
 
+def param_hints(func: Any) -> dict[str, Any]:
+    """Resolve a callable's parameter type hints, without ``return``.
+
+    Unresolvable annotations yield an empty dict. The builder resolves once
+    per handler and shares the result between parameter and enum handling.
+    """
+    try:
+        hints = get_type_hints(func, include_extras=True)
+    except _HINT_ERRORS:
+        return {}
+    hints.pop("return", None)
+    return hints
+
+
 class ParamConverter:
     """Converts handler signature parameters to click parameters."""
 
-    def to_click_params(self, func: Any) -> list[click.Parameter]:
+    def to_click_params(
+        self, func: Any, hints: dict[str, Any] | None = None
+    ) -> list[click.Parameter]:
         """Extract click parameters from a callable's signature.
 
         Parameters without default become click.Argument (positional).
         Parameters with default become click.Option.
-        ``self`` is skipped automatically.
+        ``self`` is skipped automatically. ``hints`` may carry the result of
+        ``param_hints(func)`` when the caller already resolved it.
         """
         sig = inspect.signature(func)
-        try:
-            from typing import get_type_hints
-
-            hints = get_type_hints(func, include_extras=True)
-        except Exception:
-            hints = {}
-        hints.pop("return", None)
+        if hints is None:
+            hints = param_hints(func)
 
         params: list[click.Parameter] = []
         for name, param in sig.parameters.items():
@@ -98,6 +112,15 @@ class ParamConverter:
         if hint is None:
             return click.STRING, False, False
 
+        # bool → flag
+        if hint is bool:
+            return click.BOOL, False, True
+
+        # Simple types (the common case) skip the get_origin() probe
+        simple = _SIMPLE_MAP.get(hint)
+        if simple is not None:
+            return simple, False, False
+
         # Unwrap Optional[X] → X
         origin = get_origin(hint)
         if origin is Union:
@@ -105,14 +128,6 @@ class ParamConverter:
             if len(args) == 1:
                 return self._resolve_type(args[0])
 
-        # bool → flag
-        if hint is bool:
-            return click.BOOL, False, True
-
-        # Simple types
-        if hint in _SIMPLE_MAP:
-            return _SIMPLE_MAP[hint], False, False
-
         # Literal["a", "b"] → Choice
         if origin is Literal:
             choices = [str(v) for v in get_args(hint)]
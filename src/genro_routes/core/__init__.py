@@ -12,24 +12,35 @@ Public API:
     - ``route``: Decorator for marking handler methods
     - ``is_result_wrapper``: Predicate for ResultWrapper instances
 
-Importing this module performs only imports; it does not register plugins
-or instantiate routers.
+Importing this module loads none of the submodules: each name is imported
+on first access (PEP 562), through the same ``genro_routes._lazy`` helper as
+the top-level package.
+It does not register plugins or instantiate routers.
 """
 
-from .base_router import BaseRouter
-from .context import RoutingContext
-from .decorators import route
-from .router import Router
-from .router_interface import RouterInterface
-from .routing import RoutingClass, Section, is_result_wrapper
-
-__all__ = [
-    "BaseRouter",
-    "Router",
-    "RouterInterface",
-    "RoutingClass",
-    "RoutingContext",
-    "Section",
-    "is_result_wrapper",
-    "route",
-]
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - static view of the lazy exports
+    from .base_router import BaseRouter as BaseRouter
+    from .context import RoutingContext as RoutingContext
+    from .decorators import route as route
+    from .router import Router as Router
+    from .router_interface import RouterInterface as RouterInterface
+    from .routing import RoutingClass as RoutingClass
+    from .routing import Section as Section
+    from .routing import is_result_wrapper as is_result_wrapper
+
+_CORE_EXPORTS: tuple[tuple[str, str], ...] = (
+    ("BaseRouter", ".base_router"),
+    ("Router", ".router"),
+    ("RouterInterface", ".router_interface"),
+    ("RoutingClass", ".routing"),
+    ("RoutingContext", ".context"),
+    ("Section", ".routing"),
+    ("is_result_wrapper", ".routing"),
+    ("route", ".decorators"),
+)
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, globals(), _CORE_EXPORTS)
@@ -22,9 +22,24 @@ Constructor signature::
 - ``default_entry``: the fallback entry name (default: "index") used when a path
   cannot be fully resolved. The router returns this entry with any unconsumed
   path segments passed as positional arguments when invoked.
-- Slots: ``instance``, ``name``, ``prefix``, ``description``, ``default_entry``,
+- Slots: ``instance``, ``_owner_type`` (``type(instance)``, cached for
+  binding), ``name``, ``prefix``, ``description``, ``default_entry``,
   ``__entries_raw`` (logical name → MethodEntry with handler), ``_children``
-  (alias → child router), ``_get_defaults``, ``_bound``.
+  (alias → child router), ``_get_defaults``, ``_bound``, ``_revision``,
+  ``_suspend_rebuild``, ``_node_cache``, ``_node_cache_rev``, plus
+  ``__weakref__`` so routers stay weak-referenceable.
+
+Revision counter
+----------------
+``revision`` is a monotonic counter bumped (via ``_touch``) whenever this
+router or any router below it changes in a way visible to ``nodes()``:
+entry registration, include/detach, branch declaration, plugin attachment
+and plugin configuration. ``_touch`` propagates the bump up the
+``_routing_parent`` chain, so a consumer holding the root router can cache
+anything derived from the tree and rebuild it only when the revision moves.
+Runtime-evaluated inputs (``CapabilitiesSet`` members, filter kwargs) and
+plugin runtime data (``set_runtime_data``) are not tracked: they are not part
+of the tree.
 
 Lazy binding
 ------------
@@ -34,15 +49,29 @@ is needed.
 
 Marker discovery
 ----------------
-``_iter_marked_methods`` walks the MRO of ``type(owner)`` (child classes
-first, so derived overrides win), scans ``__dict__`` for plain functions
-carrying ``_route_decorator_kw`` markers. All markers belong to this router.
+``_route_manifest(cls)`` walks the MRO of a class (child classes first, so
+derived overrides win), scans ``__dict__`` for plain functions carrying
+``_route_decorator_kw`` markers, and stores the result on the class itself.
+The scan runs once per class, on the first bind of its first instance (not at
+class creation, so markers attached after the class body still count);
+every later instance binds from the stored manifest. ``_iter_marked_methods``
+and the lazy-branch description both read it. All markers belong to this
+router.
+
+The manifest is never invalidated: ``@route`` functions added to (or replaced
+on) a class after its first instance has bound are not seen by any later
+instance of that class. Finish building a routed class before instantiating
+it, or register late handlers per instance with ``add_entry``.
 
 Handler table and wrapping
 --------------------------
 - ``_register_callable`` creates a ``MethodEntry`` and stores it in ``_entries``.
 - ``_rebuild_handlers`` updates each entry's ``handler`` attribute by passing through
   ``_wrap_handler`` (default: passthrough). Subclasses may inject middleware.
+- ``_batch_register`` defers the rebuild and the revision bump while several
+  entries are registered, running them once when the outermost batch exits.
+  ``add_entries(pairs)``, list/comma targets and marker discovery use it; a
+  single registration outside a batch re-wraps only its own entry.
 
 Lookup and execution
 --------------------
@@ -51,6 +80,19 @@ Lookup and execution
   metadata about the resolved entry. Unconsumed path segments are passed as
   positional arguments when the node is invoked.
 
+Resolved paths are memoized per router in ``_node_cache`` (path → the
+arguments of the resolved ``RouterNode``), stamped with the root router's
+identity and revision: any change anywhere in the tree, including alias
+targets, empties the cache, and so does moving the router to another tree.
+Only paths consumed entirely are memoized: a resolution that leaves partial
+segments (positional args such as ``item/42``, or a not-found tail) would
+fill the cache with one entry per argument value. Paths resolved through a
+secondary ``include()`` link are not memoized either, since changes below
+the link bump a different root. Writes to the cache happen under a module
+lock, so concurrent ``node()`` calls are safe. ``node()`` still returns a
+fresh ``RouterNode`` per call, so error state and custom exceptions never
+leak between callers.
+
 Children (instance hierarchies)
 -------------------------------
 ``include(source, name=...)`` links a Router or RouterNode into this router.
@@ -88,18 +130,79 @@ from __future__ import annotations
 
 import inspect
 import re
-from collections.abc import Callable, Iterator
-from typing import Any
-
-from genro_toolbox.typeutils import safe_is_instance
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from types import MethodType
+from typing import TYPE_CHECKING, Any
 
 from genro_routes.plugins._base_plugin import MethodEntry
 
 from .router_interface import RouterInterface
-from .router_node import RouterNode
+from .router_node import RouterNode, _call_spec, _entry_doc
+
+if TYPE_CHECKING:
+    from .routing import RoutingClass
 
 __all__ = ["BaseRouter"]
 
+_NODE_CACHE_SIZE = 1024  # resolved paths memoized per router
+_NODE_CACHE_LOCK = threading.Lock()  # guards clear/evict/store on every _node_cache
+
+_MANIFEST_ATTR = "__genro_routes_manifest__"
+
+_BRANCH_FORMS = ("cls", "instance", "alias")  # mutually exclusive branch spec keys
+
+RouteManifest = tuple[tuple[str, Callable, tuple[dict[str, Any], ...]], ...]
+
+_ROUTING_CLASS: type[RoutingClass] | None = None
+
+
+def _routing_class() -> type[RoutingClass]:
+    """Return ``RoutingClass``, imported on first use (routing imports this module)."""
+    global _ROUTING_CLASS
+    if _ROUTING_CLASS is None:
+        from .routing import RoutingClass
+
+        _ROUTING_CLASS = RoutingClass
+    return _ROUTING_CLASS
+
+
+def _route_manifest(cls: type) -> RouteManifest:
+    """Return ``(attr_name, func, markers)`` for every ``@route`` function of ``cls``.
+
+    Walks the MRO once (derived classes first; a name seen in a subclass hides
+    the base definition, and a function reachable under several names is kept
+    once) and caches the result in the class ``__dict__``, so subclasses never
+    inherit a parent's manifest. The cache is not invalidated when the class
+    changes later (see "Marker discovery" above).
+    """
+    manifest: RouteManifest | None = cls.__dict__.get(_MANIFEST_ATTR)
+    if manifest is not None:
+        return manifest
+    found: list[tuple[str, Callable, tuple[dict[str, Any], ...]]] = []
+    seen_names: set[str] = set()
+    seen_funcs: set[int] = set()
+    for base in cls.__mro__:
+        for attr_name, value in vars(base).items():
+            if not inspect.isfunction(value):
+                continue
+            # Skip if method name already seen (MRO: derived wins)
+            if attr_name in seen_names:
+                continue
+            seen_names.add(attr_name)
+            # Skip if same function already yielded (alias deduplication)
+            func_id = id(value)
+            if func_id in seen_funcs:
+                continue
+            seen_funcs.add(func_id)
+            markers = getattr(value, "_route_decorator_kw", None)
+            if markers:
+                found.append((attr_name, value, tuple(markers)))
+    manifest = tuple(found)
+    setattr(cls, _MANIFEST_ATTR, manifest)
+    return manifest
+
 
 class BaseRouter(RouterInterface):
     """Plugin-free router bound to an object instance.
@@ -113,6 +216,7 @@ class BaseRouter(RouterInterface):
 
     __slots__ = (
         "instance",
+        "_owner_type",
         "name",
         "prefix",
         "description",
@@ -122,6 +226,11 @@ class BaseRouter(RouterInterface):
         "_branches",
         "_get_defaults",
         "_bound",
+        "_revision",
+        "_suspend_rebuild",
+        "_node_cache",
+        "_node_cache_rev",
+        "__weakref__",
     )
 
     def __init__(
@@ -136,21 +245,26 @@ class BaseRouter(RouterInterface):
     ) -> None:
         if owner is None:
             raise ValueError("Router requires a parent instance")
-        if not safe_is_instance(owner, "genro_routes.core.routing.RoutingClass"):
+        if not isinstance(owner, _routing_class()):
             raise TypeError(
                 f"Router owner must be a RoutingClass instance, got {type(owner).__name__}. "
                 "Inherit from RoutingClass to use Router."
             )
-        self.instance = owner
+        self.instance: Any = owner
+        self._owner_type = type(owner)
         self.name = "route"
         self.prefix = prefix or ""
         self.description = description
         self.default_entry = default_entry
         self._bound = False
+        self._revision = 0
+        self._suspend_rebuild = 0
+        self._node_cache: dict[str, tuple[BaseRouter, str | None, str | None]] = {}
+        self._node_cache_rev: tuple[int, int] | None = None
         self.__entries_raw: dict[str, MethodEntry] = {}
         self._children: dict[str, BaseRouter] = {}
         self._branches: dict[str, dict[str, Any]] = {}
-        defaults: dict[str, Any] = dict(get_kwargs or {})
+        defaults: dict[str, Any] = dict(get_kwargs) if get_kwargs else {}
         if get_default_handler is not None:
             defaults.setdefault("default_handler", get_default_handler)
         self._get_defaults: dict[str, Any] = defaults
@@ -166,6 +280,19 @@ class BaseRouter(RouterInterface):
             self._bind()
         return self.__entries_raw
 
+    @property
+    def revision(self) -> int:
+        """Monotonic counter bumped on every change to this router's subtree."""
+        return self._revision
+
+    def _touch(self) -> None:
+        """Bump the revision of this router and of every ancestor router."""
+        router: BaseRouter | None = self
+        while router is not None:
+            router._revision += 1
+            parent = getattr(router.instance, "_routing_parent", None)
+            router = parent.route if parent is not None else None
+
     @property
     def current_capabilities(self) -> set[str]:
         """Collect capabilities from instance and parent chain.
@@ -181,31 +308,55 @@ class BaseRouter(RouterInterface):
 
         while instance is not None:
             instance_caps = getattr(instance, "capabilities", None)
-            if instance_caps:
+            if instance_caps is not None:
+                # A CapabilitiesSet evaluates its checks once, here; a
+                # truthiness test first would evaluate them all again.
                 accumulated.update(instance_caps)
             instance = getattr(instance, "_routing_parent", None)
 
         return accumulated
 
-    def _is_known_plugin(self, prefix: str) -> bool:
-        """Check if prefix corresponds to a registered plugin name."""
+    def _known_plugin_params(self) -> dict[str, str | None]:
+        """Return ``{plugin name: plugin_default_param}`` for registered plugins."""
         try:
-            from genro_routes.core.router import Router  # type: ignore
+            from genro_routes.core.router import _plugin_params  # type: ignore
         except Exception:  # pragma: no cover - import safety
-            return False
-        return prefix in Router.available_plugins()
+            return {}
+        return _plugin_params()
 
-    def _get_plugin_default_param(self, plugin_name: str) -> str | None:
-        """Return the default parameter name for a plugin, or None."""
-        try:
-            from genro_routes.core.router import Router  # type: ignore
-        except Exception:  # pragma: no cover - import safety
-            return None
-        registry = Router.available_plugins()
-        plugin_class = registry.get(plugin_name)
-        if plugin_class is None:
-            return None
-        return getattr(plugin_class, "plugin_default_param", None)
+    def _split_plugin_options(
+        self, options: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        """Split registration kwargs into ``(core_options, plugin_options)``.
+
+        ``meta_<key>`` is grouped under ``core_options["meta"]``;
+        ``<plugin>_<key>`` goes to ``plugin_options[plugin][key]``; a bare
+        ``<plugin>=value`` maps to the plugin's ``plugin_default_param``.
+        Everything else stays a core option.
+        """
+        known = self._known_plugin_params()
+        plugin_options: dict[str, dict[str, Any]] = {}
+        core_options: dict[str, Any] = {}
+        for key, value in options.items():
+            # Handle meta_* kwargs - group under "meta" key
+            if key.startswith("meta_"):
+                core_options.setdefault("meta", {})[key[5:]] = value
+                continue
+            # One find() locates the prefix; only a known plugin prefix pays
+            # for slicing out the option key.
+            sep = key.find("_")
+            if sep >= 0:
+                plugin_name = key[:sep]
+                if plugin_name in known and sep < len(key) - 1:
+                    plugin_options.setdefault(plugin_name, {})[key[sep + 1 :]] = value
+                    continue
+            elif key in known:
+                default_param = known[key]
+                if default_param:
+                    plugin_options.setdefault(key, {})[default_param] = value
+                    continue
+            core_options[key] = value
+        return core_options, plugin_options
 
     # ------------------------------------------------------------------
     # Registration helpers
@@ -229,7 +380,8 @@ class BaseRouter(RouterInterface):
         Args:
             target: Callable, attribute name(s), comma-separated string, or wildcard marker.
             name: Logical name override for this entry.
-            metadata: Extra metadata stored on the MethodEntry.
+            metadata: Extra metadata stored on the MethodEntry. Never
+                mutated: each registered entry gets its own copy.
             replace: Allow overwriting an existing logical name.
             options: Extra metadata merged into entry metadata.
 
@@ -241,37 +393,45 @@ class BaseRouter(RouterInterface):
             AttributeError: when resolving missing attributes on owner.
             TypeError: on unsupported target type.
         """
-        entry_name = name
         # Split plugin-scoped options (<plugin>_<key>) and meta_* from core options
-        plugin_options: dict[str, dict[str, Any]] = {}
-        core_options: dict[str, Any] = {}
-        for key, value in options.items():
-            # Handle meta_* kwargs - group under "meta" key
-            if key.startswith("meta_"):
-                meta_key = key[5:]  # strip "meta_"
-                core_options.setdefault("meta", {})[meta_key] = value
-                continue
-            if "_" in key:
-                plugin_name, plug_key = key.split("_", 1)
-                if plugin_name and plug_key and self._is_known_plugin(plugin_name):
-                    plugin_options.setdefault(plugin_name, {})[plug_key] = value
-                    continue
-            elif self._is_known_plugin(key):
-                default_param = self._get_plugin_default_param(key)
-                if default_param:
-                    plugin_options.setdefault(key, {})[default_param] = value
-                    continue
-            core_options[key] = value
+        core_options, plugin_options = self._split_plugin_options(options)
+        return self._add_entry(
+            target,
+            name=name,
+            metadata=metadata,
+            replace=replace,
+            core_options=core_options,
+            plugin_options=plugin_options,
+        )
+
+    def _add_entry(
+        self,
+        target: Any,
+        *,
+        name: str | None,
+        metadata: dict[str, Any] | None,
+        replace: bool,
+        core_options: dict[str, Any],
+        plugin_options: dict[str, dict[str, Any]],
+    ) -> BaseRouter:
+        """``add_entry`` body, taking options already split.
+
+        List and comma-separated targets recurse here with the same split
+        options, so registration kwargs are classified once per call.
+        """
+        entry_name = name
 
         if isinstance(target, (list, tuple, set)):
-            for entry in target:
-                self.add_entry(
-                    entry,
-                    name=entry_name,
-                    metadata=dict(metadata or {}),
-                    replace=replace,
-                    **core_options,
-                )
+            with self._batch_register():
+                for entry in target:
+                    self._add_entry(
+                        entry,
+                        name=entry_name,
+                        metadata=metadata,
+                        replace=replace,
+                        core_options=core_options,
+                        plugin_options=plugin_options,
+                    )
             return self
 
         if isinstance(target, str):
@@ -279,38 +439,41 @@ class BaseRouter(RouterInterface):
             if not target:
                 return self
             if target in {"*", "_all_", "__all__"}:
-                self._register_marked(
-                    name=entry_name,
-                    metadata=metadata,
-                    replace=replace,
-                    extra=core_options,
-                    plugin_options=plugin_options,
-                )
+                with self._batch_register():
+                    self._register_marked(
+                        name=entry_name,
+                        metadata=metadata,
+                        replace=replace,
+                        extra=core_options,
+                        plugin_options=plugin_options,
+                    )
                 self._bound = True  # Mark as bound after marker discovery
                 return self
             if "," in target:
-                for chunk in target.split(","):
-                    chunk = chunk.strip()
-                    if chunk:
-                        self.add_entry(
-                            chunk,
-                            name=entry_name,
-                            metadata=dict(metadata or {}),
-                            replace=replace,
-                            **core_options,
-                        )
+                with self._batch_register():
+                    for chunk in target.split(","):
+                        chunk = chunk.strip()
+                        if chunk:
+                            self._add_entry(
+                                chunk,
+                                name=entry_name,
+                                metadata=metadata,
+                                replace=replace,
+                                core_options=core_options,
+                                plugin_options=plugin_options,
+                            )
                 return self
             bound = getattr(self.instance, target)
         elif callable(target):
             bound = (
                 target
-                if inspect.ismethod(target)
-                else target.__get__(self.instance, type(self.instance))
+                if isinstance(target, MethodType)
+                else target.__get__(self.instance, self._owner_type)
             )
         else:
             raise TypeError(f"Unsupported entry target: {target!r}")
 
-        entry_meta = dict(metadata or {})
+        entry_meta = dict(metadata) if metadata else {}
         entry_meta.update(core_options)
         self._register_callable(
             bound,
@@ -321,6 +484,42 @@ class BaseRouter(RouterInterface):
         )
         return self
 
+    def add_entries(
+        self,
+        pairs: Iterable[tuple[str, Any]],
+        *,
+        replace: bool = False,
+    ) -> BaseRouter:
+        """Register several handlers in one batch.
+
+        Equivalent to calling ``add_entry(target, name=name, replace=replace)``
+        for each pair, but handlers are wrapped and the revision is bumped
+        once for the whole batch instead of once per entry.
+
+        Args:
+            pairs: Iterable of ``(name, target)`` tuples.
+            replace: Allow overwriting existing logical names.
+
+        Returns:
+            self (to allow chaining).
+        """
+        with self._batch_register():
+            for entry_name, target in pairs:
+                self.add_entry(target, name=entry_name, replace=replace)
+        return self
+
+    @contextmanager
+    def _batch_register(self) -> Iterator[None]:
+        """Defer handler rebuild and revision bump until the outermost batch exits."""
+        self._suspend_rebuild += 1
+        try:
+            yield
+        finally:
+            self._suspend_rebuild -= 1
+            if not self._suspend_rebuild:
+                self._rebuild_handlers()
+                self._touch()
+
     def _register_callable(
         self,
         bound: Callable,
@@ -336,7 +535,9 @@ class BaseRouter(RouterInterface):
         Args:
             bound: The bound method to register.
             name: Optional name override (otherwise uses func name with prefix stripped).
-            metadata: Extra metadata to attach to the entry.
+            metadata: Extra metadata to attach to the entry. The dict is
+                stored as the entry's metadata (not copied): callers pass a
+                fresh dict built for this entry.
             replace: If True, allow overwriting existing entry.
             plugin_options: Per-plugin configuration from decorator kwargs.
             endpoint_id: Optional globally unique identifier for reverse lookup.
@@ -349,7 +550,7 @@ class BaseRouter(RouterInterface):
             func=bound,
             router=self,
             plugins=[],
-            metadata=dict(metadata or {}),
+            metadata=metadata if metadata is not None else {},
             endpoint_id=endpoint_id,
         )
         # Attach plugin-scoped config to metadata for later consumption by plugin-enabled routers.
@@ -357,7 +558,10 @@ class BaseRouter(RouterInterface):
             entry.metadata["plugin_config"] = plugin_options
         self._entries[logical_name] = entry
         self._after_entry_registered(entry)
-        self._rebuild_handlers()
+        if self._suspend_rebuild:
+            return
+        self._rebuild_handlers(only=logical_name)
+        self._touch()
 
     def _register_marked(
         self,
@@ -374,39 +578,21 @@ class BaseRouter(RouterInterface):
         this router's name and registers each as an entry.
         """
         for func, marker in self._iter_marked_methods():
-            entry_override = marker.pop("entry_name", None)
-            marker_endpoint_id = marker.pop("endpoint_id", None)
-            entry_name = name if name is not None else entry_override
-            entry_meta = dict(metadata or {})
-            entry_meta.update(marker)
+            entry_name = name if name is not None else marker.get("entry_name")
+            marker_endpoint_id = marker.get("endpoint_id")
+            entry_meta = dict(metadata) if metadata else {}
+            for key, value in marker.items():
+                if key != "entry_name" and key != "endpoint_id":
+                    entry_meta[key] = value
             entry_meta.update(extra)
             # Split plugin-scoped options and meta_* from marker payload
-            marker_plugin_opts: dict[str, dict[str, Any]] = {}
-            core_marker: dict[str, Any] = {}
-            for key, value in entry_meta.items():
-                # Handle meta_* kwargs - group under "meta" key
-                if key.startswith("meta_"):
-                    meta_key = key[5:]  # strip "meta_"
-                    core_marker.setdefault("meta", {})[meta_key] = value
-                    continue
-                if "_" in key:
-                    plugin_name, plug_key = key.split("_", 1)
-                    if plugin_name and plug_key and self._is_known_plugin(plugin_name):
-                        marker_plugin_opts.setdefault(plugin_name, {})[plug_key] = value
-                        continue
-                elif self._is_known_plugin(key):
-                    default_param = self._get_plugin_default_param(key)
-                    if default_param:
-                        marker_plugin_opts.setdefault(key, {})[default_param] = value
-                        continue
-                core_marker[key] = value
-            entry_meta = core_marker
+            entry_meta, marker_plugin_opts = self._split_plugin_options(entry_meta)
             merged_plugin_opts: dict[str, dict[str, Any]] = {}
             if plugin_options:
                 merged_plugin_opts.update(plugin_options)
             for pname, pdata in marker_plugin_opts.items():
                 merged_plugin_opts.setdefault(pname, {}).update(pdata)
-            bound = func.__get__(self.instance, type(self.instance))
+            bound = func.__get__(self.instance, self._owner_type)
             self._register_callable(
                 bound,
                 name=entry_name,
@@ -419,34 +605,14 @@ class BaseRouter(RouterInterface):
     def _iter_marked_methods(self) -> Iterator[tuple[Callable, dict[str, Any]]]:
         """Yield (func, marker_dict) for methods decorated with @route.
 
-        Walks the MRO (child classes first) and scans __dict__ for functions
-        carrying _route_decorator_kw markers. All markers belong to this
-        router (one router per class).
+        Reads the class manifest built by ``_route_manifest`` (MRO walk,
+        derived classes first). Marker dicts are the decorator's own and are
+        shared by every instance of the class: callers must treat them as
+        read-only. All markers belong to this router (one router per class).
         """
-        cls = type(self.instance)
-        # Track seen method names to respect MRO (derived class wins)
-        # Track seen function ids to avoid duplicate registration of aliases (alias = original)
-        seen_names: set[str] = set()
-        seen_funcs: set[int] = set()
-        for base in cls.__mro__:
-            base_dict = vars(base)
-            for attr_name, value in base_dict.items():
-                if not inspect.isfunction(value):
-                    continue
-                # Skip if method name already seen (MRO: derived wins)
-                if attr_name in seen_names:
-                    continue
-                seen_names.add(attr_name)
-                # Skip if same function already yielded (alias deduplication)
-                func_id = id(value)
-                if func_id in seen_funcs:
-                    continue
-                seen_funcs.add(func_id)
-                markers = getattr(value, "_route_decorator_kw", None)
-                if not markers:
-                    continue
-                for marker in markers:
-                    yield value, dict(marker)
+        for _attr_name, func, markers in _route_manifest(self._owner_type):
+            for marker in markers:
+                yield func, marker
 
     def _resolve_name(self, func_name: str, *, name_override: str | None) -> str:
         """Compute the logical entry name from the function name.
@@ -509,8 +675,17 @@ class BaseRouter(RouterInterface):
     # ------------------------------------------------------------------
     # Handler rebuilding
     # ------------------------------------------------------------------
-    def _rebuild_handlers(self) -> None:
-        """Rebuild wrapped handlers for all entries owned by this router."""
+    def _rebuild_handlers(self, only: str | None = None) -> None:
+        """Rebuild wrapped handlers for all entries owned by this router.
+
+        Args:
+            only: Rebuild just this entry (a single registration leaves the
+                other handlers unchanged).
+        """
+        if only is not None:
+            entry = self.__entries_raw[only]
+            entry.handler = self._wrap_handler(entry, entry.func)
+            return
         for entry in self.__entries_raw.values():
             if entry.router is not self:
                 continue  # alias — handler belongs to the source router
@@ -583,8 +758,10 @@ class BaseRouter(RouterInterface):
         owner = source.instance
         is_primary = owner is not None and getattr(owner, "_routing_parent", None) is None
         if is_primary:
+            source._drop_node_cache()
             source._on_attached_to_parent(self)
             object.__setattr__(owner, "_routing_parent", self.instance)
+        self._touch()
 
     # ------------------------------------------------------------------
     # Branches: declarative factory-based subrouters (lazy/eager)
@@ -604,8 +781,7 @@ class BaseRouter(RouterInterface):
         The timing is derived from the form (``cls`` → lazy, ``instance`` →
         eager); there is no ``lazy`` flag.
         """
-        items = [specs] if isinstance(specs, dict) else list(specs)
-        for spec in items:
+        for spec in (specs,) if isinstance(specs, dict) else specs:
             self._add_branch_spec(spec)
 
     def _add_branch_spec(self, spec: dict[str, Any]) -> None:
@@ -616,7 +792,7 @@ class BaseRouter(RouterInterface):
         name = spec["name"]
         if name in self._branches or name in self._children:
             raise ValueError(f"Branch name collision: {name}")
-        forms = [k for k in ("cls", "instance", "alias") if k in spec]
+        forms = [k for k in _BRANCH_FORMS if k in spec]
         if len(forms) != 1:
             raise ValueError(
                 f"Branch '{name}': exactly one of 'cls', 'instance', 'alias' is required"
@@ -626,12 +802,13 @@ class BaseRouter(RouterInterface):
             # Alias branch: a symlink to an absolute path from the tree root.
             # No instance is ever built for it; navigation rewrites the path.
             self._branches[name] = {"name": name, "alias": spec["alias"]}
+            self._touch()
             return
         if form == "instance":
             if "params" in spec:
                 raise ValueError(f"Branch '{name}': 'params' is not allowed with 'instance'")
             child = spec["instance"]
-            if not safe_is_instance(child, "genro_routes.core.routing.RoutingClass"):
+            if not isinstance(child, _routing_class()):
                 raise TypeError(f"Branch '{name}': 'instance' must be a RoutingClass instance")
             bound = getattr(child, "_routing_parent", None)
             if bound is not None and bound is not self.instance:
@@ -647,6 +824,7 @@ class BaseRouter(RouterInterface):
             "cls": spec["cls"],
             "params": dict(spec.get("params") or {}),
         }
+        self._touch()
 
     def remove_branch(self, name: str) -> None:
         """Remove a declared branch. If already materialized, detach its child."""
@@ -654,6 +832,7 @@ class BaseRouter(RouterInterface):
         child = self._children.get(name)
         if child is not None:
             self.detach_instance(child.instance)
+        self._touch()
 
     @property
     def branches(self) -> dict[str, dict[str, Any]]:
@@ -717,28 +896,15 @@ class BaseRouter(RouterInterface):
         instance, so ``nodes()`` can describe a lazy branch's leaves cheaply.
         """
         entries: dict[str, Any] = {}
-        seen_names: set[str] = set()
-        seen_funcs: set[int] = set()
-        for base in cls.__mro__:
-            for attr_name, value in vars(base).items():
-                if not inspect.isfunction(value) or attr_name in seen_names:
-                    continue
-                seen_names.add(attr_name)
-                func_id = id(value)
-                if func_id in seen_funcs:
-                    continue
-                seen_funcs.add(func_id)
-                markers = getattr(value, "_route_decorator_kw", None)
-                if not markers:
-                    continue
-                for marker in markers:
-                    entry_name = marker.get("entry_name") or attr_name
-                    entries[entry_name] = {
-                        "name": entry_name,
-                        "callable": value,
-                        "metadata": {},
-                        "doc": inspect.getdoc(value) or "",
-                    }
+        for attr_name, value, markers in _route_manifest(cls):
+            for marker in markers:
+                entry_name = marker.get("entry_name") or attr_name
+                entries[entry_name] = {
+                    "name": entry_name,
+                    "callable": value,
+                    "metadata": {},
+                    "doc": inspect.getdoc(value) or "",
+                }
         return entries
 
     def _include_node(self, source: Any, name: str | None) -> None:
@@ -755,16 +921,18 @@ class BaseRouter(RouterInterface):
         if name in self._entries and self._entries[name] is not entry:
             raise ValueError(f"Entry name collision: {name}")
         self._BaseRouter__entries_raw[name] = entry  # type: ignore[attr-defined]
+        self._touch()
 
     def detach_instance(self, routing_child: Any) -> BaseRouter:
         """Detach all routers belonging to a RoutingClass instance."""
-        if not safe_is_instance(routing_child, "genro_routes.core.routing.RoutingClass"):
+        if not isinstance(routing_child, _routing_class()):
             raise TypeError("detach_instance() requires a RoutingClass instance")
         removed: list[str] = []
         for alias, router in list(self._children.items()):
             if router.instance is routing_child:
                 removed.append(alias)
                 self._children.pop(alias, None)
+                router._drop_node_cache()
 
         if getattr(routing_child, "_routing_parent", None) is self.instance:
             object.__setattr__(routing_child, "_routing_parent", None)
@@ -777,6 +945,9 @@ class BaseRouter(RouterInterface):
                     r for r in children_list if r.instance is not routing_child
                 ]
 
+        if removed:
+            self._touch()
+
         # No hard error if nothing was removed; detach is best-effort.
         return routing_child  # type: ignore[no-any-return]
 
@@ -815,21 +986,17 @@ class BaseRouter(RouterInterface):
             router.get_url("billing/detail", invoice_id=123)
             # → "billing/detail/123"
         """
-        node = self._find_candidate_node(path)
+        node = self._cached_candidate_node(path)
         if node._entry is None:
             raise ValueError(f"get_url: path '{path}' does not resolve to a handler")
         base: str = node.path or ""
         if not kwargs:
             return base
-        # Get positional parameter names from the handler signature
-        sig = inspect.signature(node._entry.func)
-        positional_names = [
-            p.name
-            for p in sig.parameters.values()
-            if p.name != "self"
-            and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+        # Positional parameter names, derived once per entry (see _call_spec)
+        positional_names, _ = _call_spec(node._entry)
+        segments = [
+            str(kwargs[name]) for name in positional_names if name != "self" and name in kwargs
         ]
-        segments = [str(kwargs[name]) for name in positional_names if name in kwargs]
         if segments:
             return f"{base}/{'/'.join(segments)}"
         return base
@@ -838,7 +1005,10 @@ class BaseRouter(RouterInterface):
     # Node resolution
     # ------------------------------------------------------------------
     def _find_candidate_node(
-        self, path: str, _alias_seen: frozenset[int] | None = None
+        self,
+        path: str,
+        _alias_seen: frozenset[int] | None = None,
+        _trail: list[BaseRouter] | None = None,
     ) -> RouterNode:
         """Resolve path to a candidate RouterNode without permission checks.
 
@@ -851,6 +1021,8 @@ class BaseRouter(RouterInterface):
         Args:
             path: Path to resolve (e.g., "entry", "child/entry/arg1/arg2",
                   or "@endpoint_id" for reverse lookup).
+            _alias_seen: Internal — alias spec ids already followed (cycle guard).
+            _trail: Internal — collects every router the walk enters.
 
         Returns:
             RouterNode with entry reference. If path not found, node.error
@@ -863,32 +1035,52 @@ class BaseRouter(RouterInterface):
         if stripped.startswith("@"):
             return self._find_by_endpoint_id(stripped[1:])
 
-        parts = stripped.split("/")
-        router: BaseRouter | None = self
-        pathlist: list[str] = []
-
-        while parts and router:
-            last_router = router
-            head = parts.pop(0)
+        # The router tree is the segment trie: each level is one dict probe
+        # into _entries and one into _children. The path is walked in place
+        # with str.find: ``pos`` is the start of the current segment, so the
+        # consumed prefix is ``stripped[:pos - 1]`` and no segment list is
+        # built unless unconsumed segments become partial args.
+        router: BaseRouter = self
+        pos = 0
+        while True:
+            nxt = stripped.find("/", pos)
+            seg_end = len(stripped) if nxt < 0 else nxt
+            head = stripped[pos:seg_end]
             # Alias branch: rewrite the path to the target (absolute, from root)
             # and resolve from there. Guard against alias cycles.
-            alias_spec = router._alias_spec(head)
-            if alias_spec is not None:
-                return router._resolve_alias(alias_spec, parts, _alias_seen)
-            pathlist.append(head)
+            if router._branches:
+                alias_spec = router._alias_spec(head)
+                if alias_spec is not None:
+                    rest = stripped[nxt + 1 :].split("/") if nxt >= 0 else []
+                    return router._resolve_alias(alias_spec, rest, _alias_seen, _trail)
             if head in router._entries:
-                return RouterNode(router, entry_name=head, partial=parts, path="/".join(pathlist))
-            if head not in router._children and head in router._branches:
+                partial = stripped[nxt + 1 :].split("/") if nxt >= 0 else []
+                return RouterNode(
+                    router, entry_name=head, partial=partial, path=stripped[:seg_end]
+                )
+            children = router._children
+            if head not in children and head in router._branches:
                 router._materialize_branch(head)
-            router = router._children.get(head)
-
-        if router:
-            return RouterNode(router, path="/".join(pathlist))
-
-        return RouterNode(last_router, partial=[head] + parts, path="/".join(pathlist[:-1]))
+            child = children.get(head)
+            if child is None:
+                return RouterNode(
+                    router,
+                    partial=stripped[pos:].split("/"),
+                    path=stripped[: pos - 1] if pos else "",
+                )
+            if _trail is not None:
+                _trail.append(child)
+            if nxt < 0:
+                return RouterNode(child, path=stripped)
+            router = child
+            pos = nxt + 1
 
     def _resolve_alias(
-        self, spec: dict[str, Any], rest: list[str], seen: frozenset[int] | None
+        self,
+        spec: dict[str, Any],
+        rest: list[str],
+        seen: frozenset[int] | None,
+        trail: list[BaseRouter] | None = None,
     ) -> RouterNode:
         """Resolve an alias branch: rewrite to its absolute target + rest, from root.
 
@@ -901,7 +1093,10 @@ class BaseRouter(RouterInterface):
             raise ValueError(f"Alias cycle detected at '{spec['name']}' -> '{spec['alias']}'")
         target = spec["alias"].strip("/")
         full = "/".join([target, *rest]) if rest else target
-        return self._root_router()._find_candidate_node(full, _alias_seen=seen | {spec_id})
+        root = self._root_router()
+        if trail is not None:
+            trail.append(root)
+        return root._find_candidate_node(full, _alias_seen=seen | {spec_id}, _trail=trail)
 
     def _find_by_endpoint_id(self, endpoint_id: str) -> RouterNode:
         """Resolve an endpoint_id to a RouterNode by recursive search.
@@ -963,25 +1158,32 @@ class BaseRouter(RouterInterface):
         Returns:
             The router at the path, or None if not found.
         """
+        # One split, then an index cursor over the segments (no per-level
+        # re-slicing); empty segments are skipped.
         parts = [p for p in path.strip("/").split("/") if p]
         router: BaseRouter | None = self
-        while parts and router:
-            head = parts.pop(0)
+        for depth, head in enumerate(parts):
+            if router is None:
+                break
             # Alias branch: rewrite to the absolute target + rest, from root.
-            alias_spec = router._alias_spec(head)
-            if alias_spec is not None:
-                spec_id = id(alias_spec)
-                seen = _alias_seen or frozenset()
-                if spec_id in seen:
-                    raise ValueError(
-                        f"Alias cycle detected at '{alias_spec['name']}' -> '{alias_spec['alias']}'"
+            if router._branches:
+                alias_spec = router._alias_spec(head)
+                if alias_spec is not None:
+                    spec_id = id(alias_spec)
+                    seen = _alias_seen or frozenset()
+                    if spec_id in seen:
+                        raise ValueError(
+                            f"Alias cycle detected at '{alias_spec['name']}' -> "
+                            f"'{alias_spec['alias']}'"
+                        )
+                    target = alias_spec["alias"].strip("/")
+                    full = "/".join([target, *parts[depth + 1 :]])
+                    return router._root_router().router_at_path(
+                        full, _alias_seen=seen | {spec_id}
                     )
-                target = alias_spec["alias"].strip("/")
-                full = "/".join([target, *parts]) if parts else target
-                return router._root_router().router_at_path(full, _alias_seen=seen | {spec_id})
-            # Navigating into a real branch materializes it (open the folder).
-            if head not in router._children and head in router._branches:
-                router._materialize_branch(head)
+                # Navigating into a real branch materializes it (open the folder).
+                if head not in router._children and head in router._branches:
+                    router._materialize_branch(head)
             router = router._children.get(head)
         return router
 
@@ -993,6 +1195,7 @@ class BaseRouter(RouterInterface):
         forbidden: bool = False,
         _eager: bool = False,
         _alias_seen: frozenset[int] | None = None,
+        _pattern_re: re.Pattern[str] | None = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Return a tree of routers/entries/metadata respecting filters.
@@ -1021,6 +1224,7 @@ class BaseRouter(RouterInterface):
                     Default False: lazy branches and aliases appear as
                     unresolved markers, nothing is constructed.
             _alias_seen: Internal — alias spec ids already expanded (cycle guard).
+            _pattern_re: Internal — ``pattern`` already compiled by the caller.
             **kwargs: Filter arguments passed to plugins via deny_reason().
 
         Returns:
@@ -1049,18 +1253,26 @@ class BaseRouter(RouterInterface):
             # branch (lazy included). Aliases stay as specs, resolved below.
             for branch_name in [n for n, s in list(self._branches.items()) if "alias" not in s]:
                 self._materialize_branch(branch_name)
-        # Compile pattern once if provided
-        pattern_re = re.compile(pattern) if pattern else None
+        # Compile pattern once at the top call; recursion passes it down
+        pattern_re = _pattern_re
+        if pattern_re is None and pattern:
+            pattern_re = re.compile(pattern)
 
         entries: dict[str, Any] = {}
-        for entry in self._entries.values():
-            if pattern_re is not None and not pattern_re.search(entry.name):
-                continue
-            allow_result = self._entry_invalid_reason(entry, **kwargs)
+        # Filter kwargs are prepared once per router, not once per entry.
+        prepared = self._prepare_filter_args(kwargs)
+        candidates: Iterable[MethodEntry] = self._entries.values()
+        if pattern_re is not None:
+            search = pattern_re.search
+            candidates = [entry for entry in candidates if search(entry.name)]
+        invalid_reason = self._prepared_invalid_reason
+        node_info = self._entry_node_info
+        for entry in candidates:
+            allow_result = invalid_reason(entry, prepared)
             if allow_result == "":
-                entries[entry.name] = self._entry_node_info(entry)
+                entries[entry.name] = node_info(entry)
             elif forbidden:
-                entry_info = self._entry_node_info(entry)
+                entry_info = node_info(entry)
                 entry_info["forbidden"] = allow_result
                 entries[entry.name] = entry_info
 
@@ -1075,6 +1287,7 @@ class BaseRouter(RouterInterface):
                     forbidden=forbidden,
                     _eager=_eager,
                     _alias_seen=_alias_seen,
+                    _pattern_re=pattern_re,
                     **kwargs,
                 )
                 for child_name, child in self._children.items()
@@ -1103,6 +1316,7 @@ class BaseRouter(RouterInterface):
                             forbidden=forbidden,
                             _eager=True,
                             _alias_seen=seen | {spec_id},
+                            _pattern_re=pattern_re,
                             **kwargs,
                         )
                         marker["alias"] = spec["alias"]
@@ -1184,8 +1398,8 @@ class BaseRouter(RouterInterface):
 
             If error is set, calling the node raises the mapped exception.
         """
-        # Find candidate node (pure path resolution)
-        candidate = self._find_candidate_node(path)
+        # Find candidate node (pure path resolution), memoized per path
+        candidate = self._cached_candidate_node(path)
         candidate.set_custom_exceptions(errors)
 
         # Set error via _entry_invalid_reason (handles both missing entry and plugin checks)
@@ -1193,13 +1407,59 @@ class BaseRouter(RouterInterface):
 
         return candidate
 
+    def _cached_candidate_node(self, path: str) -> RouterNode:
+        """Resolve ``path`` through ``_node_cache``, falling back to a full walk.
+
+        The cache is stamped with the identity and revision of the root router.
+        Only resolutions that consume the whole path, and whose every router
+        belongs to that same tree, are stored: a walk through a secondary
+        ``include()`` link reaches routers whose changes bump another root, so
+        it is recomputed on every call.
+        """
+        cache = self._node_cache
+        root = self._root_router()
+        stamp = (id(root), root._revision)
+        if self._node_cache_rev == stamp:
+            hit = cache.get(path)
+            if hit is not None:
+                router, entry_name, node_path = hit
+                return RouterNode(router, entry_name=entry_name, path=node_path)
+
+        trail: list[BaseRouter] = []
+        candidate = self._find_candidate_node(path, _trail=trail)
+        if candidate._partial:
+            return candidate
+        if path.strip("/").startswith("@"):
+            # Endpoint lookups search the whole reachable tree: keep hits only.
+            if candidate._entry_name is None:
+                return candidate
+            trail.append(candidate._router)
+        if any(router._root_router() is not root for router in trail):
+            return candidate
+        # Resolution may materialize lazy branches, which moves the revision.
+        stamp = (id(root), root._revision)
+        with _NODE_CACHE_LOCK:
+            if self._node_cache_rev != stamp:
+                cache.clear()
+                self._node_cache_rev = stamp
+            if len(cache) >= _NODE_CACHE_SIZE:
+                del cache[next(iter(cache))]  # FIFO eviction
+            cache[path] = (candidate._router, candidate._entry_name, candidate.path)
+        return candidate
+
+    def _drop_node_cache(self) -> None:
+        """Empty ``_node_cache`` (the router moved to another tree)."""
+        with _NODE_CACHE_LOCK:
+            self._node_cache.clear()
+            self._node_cache_rev = None
+
     def _entry_node_info(self, entry: MethodEntry) -> dict[str, Any]:
         """Build info dict for a single entry."""
         info: dict[str, Any] = {
             "name": entry.name,
             "callable": entry.func,
             "metadata": entry.metadata,
-            "doc": inspect.getdoc(entry.func) or entry.func.__doc__ or "",
+            "doc": _entry_doc(entry),
         }
         extra = self._describe_entry_extra(entry, info)
         if extra:
@@ -1207,18 +1467,8 @@ class BaseRouter(RouterInterface):
         return info
 
     def _get_plugin_info(self) -> dict[str, Any]:
-        """Build plugin_info dict from _plugin_info store."""
-        info_source = getattr(self, "_plugin_info", {}) or {}
-        return {
-            pname: {
-                key: {
-                    "config": dict(slot.get("config", {})),
-                    "locals": dict(slot.get("locals", {})),
-                }
-                for key, slot in pdata.items()
-            }
-            for pname, pdata in info_source.items()
-        }
+        """Hook: plugin_info snapshot for nodes() (base router has no plugins)."""
+        return {}
 
     # ------------------------------------------------------------------
     # Plugin hooks (no-op for BaseRouter)
@@ -1260,3 +1510,16 @@ class BaseRouter(RouterInterface):
         if entry is None:
             return "not_found"
         return ""
+
+    def _prepare_filter_args(self, filters: dict[str, Any]) -> Any:
+        """Hook: pre-process filter kwargs once for a batch of entry checks.
+
+        ``nodes()`` calls this once per router and passes the result to
+        ``_prepared_invalid_reason`` for every entry. The base router has
+        nothing to prepare.
+        """
+        return filters
+
+    def _prepared_invalid_reason(self, entry: MethodEntry | None, prepared: Any) -> str:
+        """Hook: ``_entry_invalid_reason`` with filters from ``_prepare_filter_args``."""
+        return self._entry_invalid_reason(entry, **prepared)
@@ -17,6 +17,11 @@ Global registry
 ``Router.register_plugin(name, plugin_class)`` validates that ``plugin_class``
 is a subclass of ``BasePlugin`` and ``name`` is non-empty.
 
+The built-in plugins (logging, pydantic, auth, env, channel) self-register
+when their modules are imported. ``_ensure_builtin_plugins`` imports them once,
+on first use of the registry (router construction, ``register_plugin``,
+``available_plugins``), so ``import genro_routes`` does not pay for them.
+
 Attaching plugins
 -----------------
 ``plug(plugin_name, **config)`` looks up the plugin class by name in the global
@@ -50,9 +55,12 @@ Example::
 
 from __future__ import annotations
 
+import sys
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass
 from functools import wraps
+from importlib import import_module
 from typing import Any
 
 from genro_toolbox import dictExtract
@@ -63,6 +71,82 @@ from genro_routes.plugins._base_plugin import BasePlugin, MethodEntry
 __all__ = ["Router"]
 
 _PLUGIN_REGISTRY: dict[str, type[BasePlugin]] = {}
+_PLUGIN_PARAMS: dict[str, str | None] = {}  # name -> plugin_default_param snapshot
+
+_BUILTIN_PLUGINS = ("logging", "pydantic", "auth", "env", "channel")
+_EMPTY: dict[str, Any] = {}  # shared read-only fallback; never mutated
+_builtins_loaded = False
+_builtins_loading = False  # True while the loading thread runs the imports
+_builtins_lock = threading.RLock()
+
+
+def _ensure_builtin_plugins() -> None:
+    """Import the built-in plugin modules once so they self-register.
+
+    A plugin whose third-party dependency is not installed is skipped
+    instead of breaking the import; a missing ``genro_routes`` module is
+    still an error. Re-running the loop after a failure is cheap: modules
+    that already registered come straight from ``sys.modules``.
+
+    ``_builtins_loaded`` is set only once every import has run, so other
+    threads wait on the lock until the registry is complete, and a failed
+    import is retried on the next call. Plugin modules call
+    ``register_plugin`` (and so this function) while being imported: the
+    lock is reentrant and ``_builtins_loading`` turns those nested calls
+    into no-ops.
+    """
+    global _builtins_loaded, _builtins_loading
+    if _builtins_loaded:
+        return
+    with _builtins_lock:
+        if _builtins_loaded or _builtins_loading:
+            return
+        _builtins_loading = True
+        try:
+            for plugin in _BUILTIN_PLUGINS:
+                try:
+                    import_module(f"genro_routes.plugins.{plugin}")
+                except ModuleNotFoundError as exc:
+                    if exc.name is None or exc.name.startswith("genro_routes"):
+                        raise
+            _builtins_loaded = True
+        finally:
+            _builtins_loading = False
+
+
+def _plugin_params() -> dict[str, str | None]:
+    """Return ``{plugin name: plugin_default_param}`` for the registry.
+
+    Option splitting consults this for every key of every registration, so
+    the mapping is built once and reused. ``register_plugin`` clears it; a
+    size mismatch also rebuilds it, covering direct registry edits.
+    """
+    _ensure_builtin_plugins()
+    if len(_PLUGIN_PARAMS) != len(_PLUGIN_REGISTRY):
+        _PLUGIN_PARAMS.clear()
+        for name, plugin_class in _PLUGIN_REGISTRY.items():
+            _PLUGIN_PARAMS[name] = getattr(plugin_class, "plugin_default_param", None)
+    return _PLUGIN_PARAMS
+
+
+def _is_reloaded_class(existing: type, candidate: type) -> bool:
+    """True if ``candidate`` replaces ``existing`` because its module was reloaded.
+
+    Both classes share module and qualified name, and the module currently in
+    ``sys.modules`` exposes ``candidate`` at that name (``importlib.reload``
+    rebinds it before the module-level ``register_plugin`` call runs).
+    Classes defined inside a function (``<locals>``) never qualify.
+    """
+    qualname = candidate.__qualname__
+    if (
+        "<locals>" in qualname
+        or (existing.__module__, existing.__qualname__) != (candidate.__module__, qualname)
+    ):
+        return False
+    current: Any = sys.modules.get(candidate.__module__)
+    for part in qualname.split("."):
+        current = getattr(current, part, None)
+    return current is candidate
 
 
 @dataclass
@@ -91,7 +175,7 @@ class Router(BaseRouter):
         - Plugin inheritance when attaching child routers
     """
 
-    __slots__ = BaseRouter.__slots__ + (
+    __slots__ = (
         "_plugin_specs",
         "_plugins",
         "_plugins_by_name",
@@ -101,6 +185,7 @@ class Router(BaseRouter):
     )
 
     def __init__(self, *args, **kwargs):
+        _ensure_builtin_plugins()
         self._plugin_specs: list[_PluginSpec] = []
         self._plugins: list[BasePlugin] = []
         self._plugins_by_name: dict[str, BasePlugin] = {}
@@ -120,12 +205,15 @@ class Router(BaseRouter):
             plugin_class: A BasePlugin subclass with plugin_code defined.
             name: Optional override name. If provided, overwrites any existing
                   registration. If not provided, uses plugin_code and raises
-                  if already registered with a different class.
+                  if already registered with a different class. The class
+                  of a reloaded module (same module and qualified name, now
+                  bound in that module) replaces the previous registration.
 
         Raises:
             TypeError: If plugin_class is not a BasePlugin subclass.
             ValueError: If plugin_code is missing or name collision occurs.
         """
+        _ensure_builtin_plugins()
         if not isinstance(plugin_class, type) or not issubclass(plugin_class, BasePlugin):
             raise TypeError("plugin_class must be a BasePlugin subclass")
         if not getattr(plugin_class, "plugin_code", None):
@@ -137,13 +225,19 @@ class Router(BaseRouter):
         # Otherwise, reject collision
         if name is None:
             existing = _PLUGIN_REGISTRY.get(code)
-            if existing is not None and existing is not plugin_class:
+            if (
+                existing is not None
+                and existing is not plugin_class
+                and not _is_reloaded_class(existing, plugin_class)
+            ):
                 raise ValueError(f"Plugin '{code}' already registered")
         _PLUGIN_REGISTRY[code] = plugin_class
+        _PLUGIN_PARAMS.clear()
 
     @classmethod
     def available_plugins(cls) -> dict[str, type[BasePlugin]]:
         """Return a copy of the global plugin registry."""
+        _ensure_builtin_plugins()
         return dict(_PLUGIN_REGISTRY)
 
     def plug(self, plugin: str | list[dict[str, Any]], **config: Any) -> Router:
@@ -208,6 +302,7 @@ class Router(BaseRouter):
         # Propagate to already-attached children so plug() is order-independent
         # (plug-then-attach and attach-then-plug produce the same result).
         self._propagate_plugin_to_children(instance)
+        self._touch()
         return self
 
     def iter_plugins(self) -> list[BasePlugin]:  # type: ignore[override]
@@ -280,6 +375,23 @@ class Router(BaseRouter):
             bucket["_all_"] = {"config": {}, "locals": {}}
         return bucket
 
+    def _known_plugin_params(self) -> dict[str, str | None]:  # type: ignore[override]
+        """Return the cached registry snapshot without the base class's import probe."""
+        return _plugin_params()
+
+    def _get_plugin_info(self) -> dict[str, Any]:  # type: ignore[override]
+        """Build the plugin_info dict for nodes() from the _plugin_info store."""
+        return {
+            pname: {
+                key: {
+                    "config": dict(slot.get("config", _EMPTY)),
+                    "locals": dict(slot.get("locals", _EMPTY)),
+                }
+                for key, slot in pdata.items()
+            }
+            for pname, pdata in self._plugin_info.items()
+        }
+
     # ------------------------------------------------------------------
     # Runtime helpers (state stored on plugin_info)
     # ------------------------------------------------------------------
@@ -309,6 +421,7 @@ class Router(BaseRouter):
             )
         entry = bucket.setdefault(method_name, {"config": {}, "locals": {}})
         entry.setdefault("locals", {})["enabled"] = bool(enabled)
+        self._touch()
 
     def is_plugin_enabled(self, method_name: str, plugin_name: str) -> bool:
         """Check if a plugin is enabled for a specific handler.
@@ -463,35 +576,43 @@ class Router(BaseRouter):
         through _on_attached_to_parent, so the per-parent _inherited_from guard
         is untouched. Idempotent: a child that already has the plugin is not
         duplicated.
+
+        The subtree is walked with an explicit stack rather than by recursion,
+        so deep trees cost one loop iteration per router instead of one
+        Python call frame.
         """
-        for child in self._children.values():
-            if not isinstance(child, Router):
-                continue
-            owner = child.instance
-            # Only true (primary) children inherit; secondary links are just
-            # navigational shortcuts and keep their own parent's plugins.
-            if owner is None or getattr(owner, "_routing_parent", None) is not self.instance:
-                continue
-
-            registered = self._plugin_children.setdefault(plugin.name, [])
-            if child not in registered:
-                registered.append(child)
-
-            child_plugin = child._plugins_by_name.get(plugin.name)
-            if child_plugin is None:
-                child_plugin = plugin.__class__(child)
-                child._plugins_by_name[plugin.name] = child_plugin
-                child._plugins.append(child_plugin)
-            child_plugin.on_attached_to_parent(plugin)
-
-            # Apply to the child's own entries only if it is already bound;
-            # otherwise its lazy _bind() will run on_decore for every plugin.
-            if child._bound:
-                child._apply_plugin_to_entries(child_plugin)
-                child._rebuild_handlers()
-
-            # Recurse so grandchildren receive the plugin too.
-            child._propagate_plugin_to_children(child_plugin)
+        pending: list[tuple[Router, BasePlugin]] = [(self, plugin)]
+        while pending:
+            parent, parent_plugin = pending.pop()
+            for child in parent._children.values():
+                if not isinstance(child, Router):
+                    continue
+                owner = child.instance
+                # Only true (primary) children inherit; secondary links are just
+                # navigational shortcuts and keep their own parent's plugins.
+                if owner is None or getattr(owner, "_routing_parent", None) is not parent.instance:
+                    continue
+
+                registered = parent._plugin_children.setdefault(parent_plugin.name, [])
+                if child not in registered:
+                    registered.append(child)
+
+                child_plugin = child._plugins_by_name.get(parent_plugin.name)
+                if child_plugin is None:
+                    child_plugin = parent_plugin.__class__(child)
+                    child._plugins_by_name[parent_plugin.name] = child_plugin
+                    child._plugins.append(child_plugin)
+                child_plugin.on_attached_to_parent(parent_plugin)
+
+                # Apply to the child's own entries only if it is already bound;
+                # otherwise its lazy _bind() will run on_decore for every plugin.
+                if child._bound:
+                    child._apply_plugin_to_entries(child_plugin)
+                    child._rebuild_handlers()
+                child._touch()
+
+                # Queue the child so grandchildren receive the plugin too.
+                pending.append((child, child_plugin))
 
     def _on_attached_to_parent(self, parent: Router) -> None:  # type: ignore[override]
         """Handle plugin inheritance when this router is attached to a parent.
@@ -541,7 +662,7 @@ class Router(BaseRouter):
         Extracts plugin_config from entry metadata and applies it via
         plugin.configure(). Then calls on_decore for each attached plugin.
         """
-        for pname, cfg in entry.metadata.get("plugin_config", {}).items():
+        for pname, cfg in entry.metadata.get("plugin_config", _EMPTY).items():
             plugin = self._plugins_by_name.get(pname)
             if plugin:
                 plugin.configure(_target=entry.name, **cfg)
@@ -571,13 +692,40 @@ class Router(BaseRouter):
         """
         if entry is None:
             return "not_found"
+        return self._prepared_invalid_reason(entry, self._prepare_filter_args(allowing_args))
+
+    def _prepare_filter_args(  # type: ignore[override]
+        self, filters: dict[str, Any]
+    ) -> list[tuple[BasePlugin, dict[str, Any]]]:
+        """Split filter kwargs into ``(plugin, plugin_kwargs)`` pairs.
+
+        None and False values are dropped; each plugin receives the kwargs
+        carrying its ``plugin_code`` prefix, with the prefix removed.
+        """
+        if not filters:
+            # Unfiltered listing: every plugin gets the shared empty kwargs
+            return [(plugin, _EMPTY) for plugin in self._plugins]
         # Filter out None and False values
-        allowing_args = {k: v for k, v in allowing_args.items() if v not in (None, False)}
-        for plugin in self._plugins:
-            # Extract kwargs for this specific plugin using its plugin_code prefix
-            plugin_kwargs = dictExtract(
-                allowing_args, f"{plugin.plugin_code}_", slice_prefix=True, pop=False
+        allowing_args = {
+            k: v for k, v in filters.items() if v is not None and v is not False
+        }
+        return [
+            (
+                plugin,
+                dictExtract(allowing_args, f"{plugin.plugin_code}_", slice_prefix=True, pop=False),
             )
+            for plugin in self._plugins
+        ]
+
+    def _prepared_invalid_reason(  # type: ignore[override]
+        self,
+        entry: MethodEntry | None,
+        prepared: list[tuple[BasePlugin, dict[str, Any]]],
+    ) -> str:
+        """Consult each plugin's deny_reason() with its pre-split kwargs."""
+        if entry is None:
+            return "not_found"
+        for plugin, plugin_kwargs in prepared:
             # Always consult plugin - it decides based on entry rules and user kwargs
             result = plugin.deny_reason(entry, **plugin_kwargs)
             if result:
@@ -630,8 +778,9 @@ class Router(BaseRouter):
             ``{"schema": <json schema | None>, "media_type": <str>}`` when a
             return schema and/or a media type exists, else an empty dict.
         """
-        schema = entry.metadata.get("pydantic", {}).get("response_schema")
-        media_type = entry.metadata.get("meta", {}).get("media_type")
+        metadata = entry.metadata
+        schema = metadata.get("pydantic", _EMPTY).get("response_schema")
+        media_type = metadata.get("meta", _EMPTY).get("media_type")
         if schema is None and media_type is None:
             return {}
         return {"schema": schema, "media_type": media_type}
@@ -654,7 +803,7 @@ class Router(BaseRouter):
             ``{"schema": <json schema | None>, "fields": [...]}`` when the
             plugin captured params, else an empty dict.
         """
-        pydantic_meta = entry.metadata.get("pydantic", {})
+        pydantic_meta = entry.metadata.get("pydantic", _EMPTY)
         if "param_fields" not in pydantic_meta:
             return {}
         return {
@@ -33,6 +33,8 @@ class RouterInterface(ABC):
         name: Router name for identification and debugging.
     """
 
+    __slots__ = ()
+
     name: str | None
 
     @abstractmethod
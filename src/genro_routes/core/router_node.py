@@ -32,6 +32,11 @@ if TYPE_CHECKING:  # pragma: no cover
 
 __all__ = ["RouterNode"]
 
+# Errors from typing.get_type_hints that mean "annotations not resolvable
+# (yet)": unresolved forward ref, bad dotted name, malformed annotation.
+# Shared by every hint resolver so they all degrade the same way.
+_HINT_ERRORS = (NameError, AttributeError, SyntaxError, TypeError)
+
 
 def _mark_coroutine(obj: Any) -> None:
     """Mark an object so iscoroutinefunction() reports it as a coroutine func.
@@ -50,6 +55,39 @@ def _mark_coroutine(obj: Any) -> None:
         obj._is_coroutine = _is_coroutine
 
 
+def _call_spec(entry: Any) -> tuple[tuple[str, ...], bool]:
+    """Return ``(positional parameter names, accepts *args)`` for an entry.
+
+    Derived from the signature once and stored on ``entry.call_spec``; the
+    pydantic plugin's captured signature is reused when present.
+    """
+    spec = entry.call_spec
+    if spec is None:
+        pydantic_meta = entry.metadata.get("pydantic", {})
+        sig = pydantic_meta.get("signature") or inspect.signature(entry.func)
+        param_names = tuple(
+            name
+            for name, p in sig.parameters.items()
+            if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        )
+        has_var_positional = pydantic_meta.get("accepts_varargs")
+        if has_var_positional is None:
+            has_var_positional = any(
+                p.kind == inspect.Parameter.VAR_POSITIONAL
+                for p in sig.parameters.values()
+            )
+        spec = entry.call_spec = (param_names, bool(has_var_positional))
+    return spec  # type: ignore[no-any-return]
+
+
+def _entry_doc(entry: Any) -> str:
+    """Return the entry's docstring, computed once and stored on ``entry.doc``."""
+    doc = entry.doc
+    if doc is None:
+        doc = entry.doc = inspect.getdoc(entry.func) or entry.func.__doc__ or ""
+    return doc  # type: ignore[no-any-return]
+
+
 class RouterNode:
     """Wrapper for router node information with callable interface.
 
@@ -137,9 +175,11 @@ class RouterNode:
         self._entry_name: str | None = entry_name
         self._entry = None
 
-        self._exceptions: dict[str, type[Exception]] = dict(self.DEFAULT_EXCEPTIONS)
-        if errors:
-            self._exceptions.update(errors)
+        # Shared class-level mapping until a caller customizes it: most nodes
+        # never do, so they skip the per-node dict copy.
+        self._exceptions: dict[str, type[Exception]] = (
+            {**self.DEFAULT_EXCEPTIONS, **errors} if errors else self.DEFAULT_EXCEPTIONS
+        )
 
         self.error: str | None = None
 
@@ -170,7 +210,7 @@ class RouterNode:
         """Return entry docstring."""
         if self._entry is None:
             return ""
-        return inspect.getdoc(self._entry.func) or self._entry.func.__doc__ or ""
+        return _entry_doc(self._entry)
 
     @property
     def metadata(self) -> dict[str, Any]:
@@ -202,24 +242,10 @@ class RouterNode:
         if not self._partial:
             return True
 
-        pydantic_meta = entry.metadata.get("pydantic", {})
-        sig = pydantic_meta.get("signature") or inspect.signature(entry.func)
-
-        param_names = [
-            name
-            for name, p in sig.parameters.items()
-            if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-        ]
-
-        has_var_positional = pydantic_meta.get("accepts_varargs")
-        if has_var_positional is None:
-            has_var_positional = any(
-                p.kind == inspect.Parameter.VAR_POSITIONAL
-                for p in sig.parameters.values()
-            )
-
+        param_names, has_var_positional = _call_spec(entry)
+        n_named = len(param_names)
         for i, value in enumerate(self._partial):
-            if i < len(param_names):
+            if i < n_named:
                 self._partial_kwargs[param_names[i]] = value
             else:
                 self._extra_args.append(value)
@@ -239,7 +265,7 @@ class RouterNode:
             self (for chaining).
         """
         if errors:
-            self._exceptions.update(errors)
+            self._exceptions = {**self._exceptions, **errors}
         return self
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
@@ -271,12 +297,14 @@ class RouterNode:
             selector = f"{self._router.name}:{path}" if path else self._router.name
             raise exc_class(selector)
 
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k not in self._partial_kwargs}
-        merged_kwargs = {**self._partial_kwargs, **filtered_kwargs}
-        all_args = (*self._extra_args, *args)
+        partial_kwargs = self._partial_kwargs
+        if partial_kwargs or self._extra_args:
+            filtered_kwargs = {k: v for k, v in kwargs.items() if k not in partial_kwargs}
+            kwargs = {**partial_kwargs, **filtered_kwargs}
+            args = (*self._extra_args, *args)
 
         try:
-            return self._entry.handler(*all_args, **merged_kwargs)  # type: ignore[attr-defined, union-attr]
+            return self._entry.handler(*args, **kwargs)  # type: ignore[attr-defined, union-attr]
         except Exception as e:
             is_validation = ValidationError is not None and isinstance(e, ValidationError)
             if is_validation or isinstance(e, TypeError):
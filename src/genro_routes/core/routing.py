@@ -134,11 +134,10 @@ import contextlib
 from fnmatch import fnmatchcase
 from typing import TYPE_CHECKING, Any
 
-from genro_toolbox.typeutils import safe_is_instance
-
 from .router import Router
 
 if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from .base_router import BaseRouter
     from .context import RoutingContext
 
 __all__ = ["RoutingClass", "Section", "ResultWrapper", "is_routing_class", "is_result_wrapper"]
@@ -191,7 +190,7 @@ class RoutingClass:
             current = object.__getattribute__(self, name)
         except AttributeError:
             return None
-        if not safe_is_instance(current, "genro_routes.core.routing.RoutingClass"):
+        if not isinstance(current, RoutingClass):
             return None
         if getattr(current, "_routing_parent", None) is not self:
             return None  # pragma: no cover - only detach if bound to this parent
@@ -231,7 +230,7 @@ class RoutingClass:
         """Read-only view of declared (not-yet-materialized) branch specs."""
         return self.route.branches
 
-    def _register_router(self, router: Router) -> None:
+    def _register_router(self, router: BaseRouter) -> None:
         """Register the router with this instance.
 
         Called automatically by Router during initialization. Raises
@@ -307,7 +306,9 @@ class RoutingClass:
                     self._paypal_configured = False
                     self.capabilities = PaymentCapabilities(self)
         """
-        return getattr(self, "_capabilities", None) or set()
+        capabilities = getattr(self, "_capabilities", None)
+        # Identity test: truthiness would call len() and evaluate every capability
+        return capabilities if capabilities is not None else set()
 
     @capabilities.setter
     def capabilities(self, value) -> None:
@@ -358,6 +359,8 @@ class Section(RoutingClass):
         svc.add_branches({"name": "admin", "instance": Section("Admin area")})
     """
 
+    __slots__ = ("__weakref__",)
+
     def __init__(self, description: str | None = None) -> None:
         if description is not None:
             self.route.description = description
@@ -385,6 +388,8 @@ class _RoutingProxy:
         >>> svc.routing.configure("?")  # introspection
     """
 
+    __slots__ = ("_owner", "__weakref__")
+
     _owner: RoutingClass
 
     def __init__(self, owner: RoutingClass):
@@ -490,7 +495,7 @@ class _RoutingProxy:
 
 def is_routing_class(obj: Any) -> bool:
     """Return True when ``obj`` is a RoutingClass instance."""
-    return safe_is_instance(obj, "genro_routes.core.routing.RoutingClass")  # type: ignore[no-any-return]
+    return isinstance(obj, RoutingClass)
 
 
 def is_result_wrapper(obj: Any) -> bool:
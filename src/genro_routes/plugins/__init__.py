@@ -13,8 +13,10 @@ Dialect plugins (OpenAPI, MCP) live in the transport layer (e.g. genro-asgi),
 not here: they read the neutral ``nodes()`` output rather than the core.
 
 Plugin Registration:
-    Plugins self-register when imported. The main ``genro_routes`` package
-    imports all built-in plugins automatically.
+    Plugins self-register when imported. Importing ``genro_routes`` does not
+    load them: the built-in plugins are imported on first use of the plugin
+    registry (creating a router, ``Router.register_plugin`` or
+    ``Router.available_plugins``).
 
 Creating Custom Plugins:
     Subclass ``BasePlugin`` from ``genro_routes.plugins._base_plugin``::
@@ -38,7 +40,7 @@ Creating Custom Plugins:
 
 Note:
     Do not import concrete plugins here to keep imports side-effect free.
-    Concrete plugin modules self-register when imported via the main package.
+    Concrete plugin modules self-register when the registry first loads them.
 """
 
-__all__: list[str] = []
+__all__: tuple[str, ...] = ()
@@ -65,7 +65,7 @@ from pydantic import validate_call
 __all__ = ["BasePlugin", "MethodEntry"]
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class MethodEntry:
     """Metadata for a registered route handler.
 
@@ -77,6 +77,10 @@ class MethodEntry:
         plugins: List of plugin names applied to this handler.
         metadata: Mutable dict for plugins to store annotations.
         endpoint_id: Optional globally unique identifier for reverse lookup.
+        call_spec: Positional parameter names and ``*args`` flag of ``func``,
+            derived once on first path-argument binding (see RouterNode).
+        doc: Cleaned docstring of ``func``, derived once on first
+            introspection (see RouterNode).
     """
 
     name: str
@@ -86,6 +90,10 @@ class MethodEntry:
     metadata: dict[str, Any] = field(default_factory=dict)
     handler: Callable = field(default=None)  # type: ignore[assignment]
     endpoint_id: str | None = field(default=None)
+    call_spec: tuple[tuple[str, ...], bool] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    doc: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Set handler to func if not provided."""
@@ -169,6 +177,7 @@ class BasePlugin:
         # Capture old config before update (only for _all_ target)
         old_config = dict(bucket["config"]) if target == "_all_" else None
         bucket["config"].update(config)
+        self._router._touch()
         # Notify children about config change (only for _all_ target)
         if target == "_all_" and old_config is not None:
             new_config = dict(bucket["config"])
@@ -16,6 +16,12 @@ When traversing a router hierarchy, capabilities are **accumulated** from all
 RoutingClass instances along the path. This allows child services to inherit
 capabilities from their parents while adding their own.
 
+The ``@capability`` methods of a ``CapabilitiesSet`` class are listed once,
+on its first iteration or ``len()``, and that table is never invalidated:
+capabilities attached to the class afterwards are still answered by ``in``
+but never appear in iteration or ``len()`` (and so never reach the
+accumulated set). Define every capability in the class body.
+
 Usage::
 
     from genro_routes import Router, RoutingClass, route
@@ -244,6 +250,29 @@ def capability(func):
     return func
 
 
+_CAPABILITY_NAMES_ATTR = "__genro_capability_names__"
+
+
+def _capability_names(cls: type) -> tuple[str, ...]:
+    """Return the public ``@capability`` method names of ``cls``, in ``dir()`` order.
+
+    The scan runs once per class and is stored in the class's own
+    ``__dict__`` (subclasses get their own table). Only the names are cached:
+    the capability methods themselves are still called on every access. The
+    table is not invalidated if the class changes later (see module docstring).
+    """
+    names = cls.__dict__.get(_CAPABILITY_NAMES_ATTR)
+    if names is None:
+        names = tuple(
+            name
+            for name in dir(cls)
+            if not name.startswith("_")
+            and getattr(getattr(cls, name, None), "_is_capability", False)
+        )
+        setattr(cls, _CAPABILITY_NAMES_ATTR, names)
+    return names
+
+
 class CapabilitiesSet:
     """Base class for dynamic capability sets.
 
@@ -282,11 +311,8 @@ class CapabilitiesSet:
 
     def __iter__(self):
         """Yield names of currently active capabilities."""
-        for name in dir(self):
-            if name.startswith("_"):
-                continue
-            method = getattr(self, name)
-            if callable(method) and getattr(method, "_is_capability", False) and method():
+        for name in _capability_names(type(self)):
+            if getattr(self, name)():
                 yield name
 
     def __contains__(self, item: str) -> bool:
@@ -298,7 +324,7 @@ class CapabilitiesSet:
 
     def __len__(self) -> int:
         """Return the number of currently active capabilities."""
-        return sum(1 for _ in self)
+        return sum(1 for name in _capability_names(type(self)) if getattr(self, name)())
 
 
 Router.register_plugin(EnvPlugin)
@@ -49,6 +49,7 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, get_type_hints
 
 try:
@@ -59,12 +60,26 @@ except ImportError as err:  # pragma: no cover - import guard
     ) from err
 
 from genro_routes.core.router import Router
+from genro_routes.core.router_node import _HINT_ERRORS
 from genro_routes.plugins._base_plugin import BasePlugin, MethodEntry
 
 if TYPE_CHECKING:
     from genro_routes.core import Router
 
 
+@lru_cache(maxsize=1024)
+def _cached_type_hints(func: Callable) -> dict[str, Any]:
+    """Resolve ``get_type_hints(func, include_extras=True)`` once per function.
+
+    Every instance of a routed class registers the same underlying functions,
+    so resolving annotations (forward refs, module globals) is shared across
+    instances. Resolution errors propagate and are not cached, so a forward
+    reference that becomes resolvable later is picked up by the next
+    registration. Callers must copy the returned dict before mutating it.
+    """
+    return get_type_hints(func, include_extras=True)
+
+
 class PydanticPlugin(BasePlugin):
     """Validate handler inputs and generate response schemas with Pydantic.
 
@@ -135,8 +150,8 @@ class PydanticPlugin(BasePlugin):
         )
 
         try:
-            hints = get_type_hints(func, include_extras=True)
-        except Exception:
+            hints = dict(_cached_type_hints(getattr(func, "__func__", func)))
+        except _HINT_ERRORS:
             hints = {}
 
         return_hint = hints.pop("return", None)
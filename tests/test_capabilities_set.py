@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 from genro_routes import RoutingClass, route
-from genro_routes.plugins.env import CapabilitiesSet, capability
+from genro_routes.plugins.env import CapabilitiesSet, _capability_names, capability
 
 
 class TestCapabilityDecorator:
@@ -124,6 +124,46 @@ class TestCapabilitiesSet:
         assert "feature" in caps
         assert len(caps) == 1
 
+    def test_capability_names_scanned_once_per_class(self):
+        """The capability table is built once per class; subclasses get their own."""
+
+        class Caps(CapabilitiesSet):
+            @capability
+            def a(self) -> bool:
+                return True
+
+            def helper(self) -> bool:
+                return True
+
+        class MoreCaps(Caps):
+            @capability
+            def b(self) -> bool:
+                return False
+
+        assert list(Caps()) == ["a"]
+        assert _capability_names(Caps) is _capability_names(Caps)
+        assert _capability_names(MoreCaps) == ("a", "b")
+        assert list(MoreCaps()) == ["a"]
+
+    def test_capabilities_added_after_first_scan_are_not_listed(self):
+        """Capabilities attached after the class was scanned stay out of the table."""
+
+        class Caps(CapabilitiesSet):
+            @capability
+            def a(self) -> bool:
+                return True
+
+        assert list(Caps()) == ["a"]
+
+        def late(self) -> bool:
+            return True
+
+        Caps.late = capability(late)
+        caps = Caps()
+        assert "late" in caps
+        assert list(caps) == ["a"]
+        assert len(caps) == 1
+
     def test_empty_capabilities_set(self):
         """Empty CapabilitiesSet works correctly."""
 
@@ -209,3 +249,23 @@ class TestCapabilitiesSetWithRouting:
         svc._caps._maintenance = False
         entries = svc.route.nodes().get("entries", {})
         assert "process" in entries
+
+    def test_current_capabilities_evaluates_each_check_once(self):
+        """Collecting router capabilities calls every capability method once."""
+
+        class CountingCaps(CapabilitiesSet):
+            def __init__(self):
+                self.calls = 0
+
+            @capability
+            def online(self) -> bool:
+                self.calls += 1
+                return True
+
+        class Service(RoutingClass):
+            def __init__(self):
+                self.capabilities = CountingCaps()
+
+        svc = Service()
+        assert svc.route.current_capabilities == {"online"}
+        assert svc.capabilities.calls == 1
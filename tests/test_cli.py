@@ -248,6 +248,23 @@ class TestEnumParam:
         result = runner.invoke(cli.click_group, ["paint", "--color", "YELLOW"])
         assert result.exit_code != 0
 
+    def test_hints_resolved_once_per_handler(self, monkeypatch):
+        from genro_routes.cli import _type_map
+
+        calls = []
+        real = _type_map.get_type_hints
+
+        def counting(func, **kwargs):
+            calls.append(func)
+            return real(func, **kwargs)
+
+        monkeypatch.setattr(_type_map, "get_type_hints", counting)
+        runner = CliRunner()
+        cli = RoutingCli(EnumService)
+        result = runner.invoke(cli.click_group, ["paint", "--color", "GREEN"])
+        assert result.exit_code == 0
+        assert len(calls) == 1
+
 
 # ---------------------------------------------------------------------------
 # Tests: help text
@@ -2,7 +2,7 @@
 
 import pytest
 
-from genro_routes import RoutingClass, route
+from genro_routes import RouterNode, RoutingClass, route
 from genro_routes.exceptions import NotFound
 
 
@@ -102,3 +102,26 @@ class TestRouterNodeInit:
         node = svc.route.node("nonexistent")
         with pytest.raises(NotFound):
             node()
+
+    def test_call_spec_is_derived_once_per_entry(self, root):
+        """Positional names are captured on the entry on first binding."""
+        entry = root.route._entries["action"]
+        assert entry.call_spec is None
+        assert root.route.node("action/1/2")() == "root.action: 1, 2"
+        spec = entry.call_spec
+        assert spec == (("x", "y"), False)
+        assert root.route.node("action/3/4")() == "root.action: 3, 4"
+        assert entry.call_spec is spec
+
+    def test_custom_exceptions_do_not_leak_into_defaults(self, root):
+        """Customizing one node's errors leaves the shared defaults untouched."""
+
+        class Missing(Exception):
+            pass
+
+        custom = root.route.node("zuz").set_custom_exceptions({"not_found": Missing})
+        with pytest.raises(Missing):
+            custom()
+        assert RouterNode.DEFAULT_EXCEPTIONS["not_found"] is NotFound
+        with pytest.raises(NotFound):
+            root.route.node("zuz")()
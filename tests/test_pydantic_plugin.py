@@ -169,3 +169,47 @@ def test_binding_error_propagates_typeerror_without_custom():
     svc = ValidateService()
     with pytest.raises(TypeError):
         svc.route.node("concat")("a", 1, "extra")
+
+
+def test_type_hints_resolved_once_per_function():
+    """Instances of the same class share the resolved hints; metadata gets a copy."""
+    from genro_routes.plugins.pydantic import _cached_type_hints
+
+    _cached_type_hints.cache_clear()
+    first = ValidateService()
+    second = ValidateService()
+    first_meta = first.route._entries["concat"].metadata["pydantic"]
+    second_meta = second.route._entries["concat"].metadata["pydantic"]
+    info = _cached_type_hints.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert first_meta["hints"] == {"text": str, "number": int}
+    assert first_meta["hints"] is not second_meta["hints"]
+    assert "return" in _cached_type_hints(ValidateService.concat)
+
+
+def test_unresolvable_hints_are_not_cached(monkeypatch):
+    """A forward ref that cannot be resolved yet disables validation until it can."""
+    import sys
+
+    from genro_routes.plugins.pydantic import _cached_type_hints
+
+    class ForwardRefService(RoutingClass):
+        def __init__(self):
+            self.route.plug("pydantic")
+
+        @route()
+        def echo(self, value: "LateType"):  # noqa: F821
+            return value
+
+    _cached_type_hints.cache_clear()
+    svc = ForwardRefService()
+    assert svc.route.node("echo")("anything") == "anything"
+    assert "model" not in svc.route._entries["echo"].metadata["pydantic"]
+    assert _cached_type_hints.cache_info().currsize == 0
+
+    monkeypatch.setattr(sys.modules[__name__], "LateType", int, raising=False)
+    later = ForwardRefService()
+    assert later.route._entries["echo"].metadata["pydantic"]["hints"] == {"value": int}
+    with pytest.raises(ValidationError):
+        later.route.node("echo")("not-a-number")
@@ -191,6 +191,16 @@ def test_plugin_enable_disable_runtime_data():
     assert svc.route.get_runtime_data("touch", "toggle", "last") is True
 
 
+def test_plugin_enabled_via_runtime_data_applies_to_next_call():
+    svc = ToggleService()
+    node = svc.route.node("touch")
+    node()
+    svc.route.set_runtime_data("touch", "toggle", "enabled", False)
+    svc.route.set_runtime_data("touch", "toggle", "last", None)
+    node()
+    assert svc.route.get_runtime_data("touch", "toggle", "last") is None
+
+
 def test_dotted_path_and_nodes_with_attached_child():
     class Child(RoutingClass):
         @route()
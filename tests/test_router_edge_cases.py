@@ -1270,3 +1270,63 @@ def test_double_plug_raises():
     api = Api()
     with pytest.raises(ValueError, match="already attached"):
         api.route.plug("pydantic")
+
+
+def test_register_plugin_accepts_reloaded_class(tmp_path, monkeypatch):
+    import importlib
+    import sys
+
+    (tmp_path / "reload_edge_plugin.py").write_text(
+        "from genro_routes import Router\n"
+        "from genro_routes.plugins._base_plugin import BasePlugin\n"
+        "\n"
+        "class ReloadPlugin(BasePlugin):\n"
+        "    plugin_code = 'reload_edge'\n"
+        "    plugin_description = 'Plugin redefined by importlib.reload'\n"
+        "\n"
+        "Router.register_plugin(ReloadPlugin)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("reload_edge_plugin")
+    first = module.ReloadPlugin
+    try:
+        importlib.reload(module)
+        assert module.ReloadPlugin is not first
+        assert Router.available_plugins()["reload_edge"] is module.ReloadPlugin
+    finally:
+        sys.modules.pop("reload_edge_plugin", None)
+
+
+def test_register_plugin_rejects_same_named_factory_classes():
+    def make_plugin():
+        class FactoryPlugin(BasePlugin):
+            plugin_code = "factory_edge"
+            plugin_description = "Built by a factory, one class per call"
+
+        return FactoryPlugin
+
+    first, second = make_plugin(), make_plugin()
+    Router.register_plugin(first)
+    with pytest.raises(ValueError, match="already registered"):
+        Router.register_plugin(second)
+    assert Router.available_plugins()["factory_edge"] is first
+
+
+def test_option_split_tracks_plugin_registry():
+    class Owner(RoutingClass):
+        def ping(self):
+            return "pong"
+
+    class LateSplitPlugin(BasePlugin):
+        plugin_code = "latesplit"
+        plugin_description = "Registered after the first option split"
+
+    svc = Owner()
+    svc.route.add_entry("ping", latesplit_level=1)
+    assert svc.route._entries["ping"].metadata["latesplit_level"] == 1
+
+    Router.register_plugin(LateSplitPlugin)
+    svc.route.add_entry("ping", name="pong", latesplit_level=2)
+    entry = svc.route._entries["pong"]
+    assert entry.metadata["plugin_config"] == {"latesplit": {"level": 2}}
+    assert "latesplit_level" not in entry.metadata
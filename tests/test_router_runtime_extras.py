@@ -459,6 +459,25 @@ def test_node_returns_entry_info():
     assert node.metadata is not None
 
 
+def test_entry_doc_is_computed_once():
+    """The cleaned docstring is stored on the entry and shared by node() and nodes()."""
+
+    class Svc(RoutingClass):
+        @route()
+        def get_item(self, item_id: int) -> dict:
+            """
+            Get an item by ID.
+            """
+            return {"id": item_id}
+
+    svc = Svc()
+    entry = svc.route._entries["get_item"]
+    assert entry.doc is None
+    assert svc.route.nodes()["entries"]["get_item"]["doc"] == "Get an item by ID."
+    assert entry.doc == "Get an item by ID."
+    assert svc.route.node("get_item").doc is entry.doc
+
+
 # -----------------------------------------------------------------------
 # Response schema in pydantic metadata
 # -----------------------------------------------------------------------
@@ -565,3 +584,293 @@ def test_list_typeddict_response_schema():
     entry = svc.route._entries["list_users"]
     schema = entry.metadata["pydantic"]["response_schema"]
     assert schema["type"] == "array"
+
+
+def test_revision_bumps_on_registration_and_propagates_to_parent():
+    class Child(RoutingClass):
+        @route()
+        def ping(self):
+            return "pong"
+
+    class Parent(RoutingClass):
+        def __init__(self):
+            self.child = Child()
+            self.add_branches({"name": "child", "instance": self.child})
+
+    parent = Parent()
+    start = parent.route.revision
+    assert start > 0  # include() of the child already counted
+
+    parent.child.route.add_entry(lambda self: "extra", name="extra")
+    assert parent.child.route.revision > 0
+    assert parent.route.revision > start
+
+
+def test_revision_bumps_on_plugin_attach_and_configuration():
+    svc = LoggingService()
+    svc.route.nodes()
+    rev = svc.route.revision
+
+    svc.route.logging.configure(before=False)
+    assert svc.route.revision > rev
+    rev = svc.route.revision
+
+    svc.route.set_plugin_enabled("hello", "logging", False)
+    assert svc.route.revision > rev
+
+    other = ManualService()
+    rev = other.route.revision
+    other.route.plug("logging")
+    assert other.route.revision > rev
+
+
+def test_revision_stable_without_changes():
+    svc = ManualService()
+    svc.route.nodes()
+    rev = svc.route.revision
+    svc.route.nodes()
+    svc.route.node("auto")()
+    assert svc.route.revision == rev
+
+
+def test_runtime_data_does_not_bump_revision():
+    svc = LoggingService()
+    svc.route.nodes()
+    rev = svc.route.revision
+    svc.route.set_runtime_data("hello", "logging", "calls", 1)
+    assert svc.route.get_runtime_data("hello", "logging", "calls") == 1
+    assert svc.route.revision == rev
+
+
+def test_add_entries_registers_batch_and_bumps_revision_once():
+    svc = ManualService()
+    svc.route.nodes()
+    rev = svc.route.revision
+
+    assert (
+        svc.route.add_entries([("one", svc.first), ("two", svc.second)]) is svc.route
+    )
+    assert svc.route.revision == rev + 1
+    assert svc.route.node("one")() == "first"
+    assert svc.route.node("two")() == "second"
+
+    with pytest.raises(ValueError, match="collision"):
+        svc.route.add_entries([("one", svc.first)])
+    svc.route.add_entries([("one", svc.second)], replace=True)
+    assert svc.route.node("one")() == "second"
+
+
+def test_builtin_plugins_available_through_registry():
+    names = set(Router.available_plugins())
+    assert {"logging", "pydantic", "auth", "env", "channel"} <= names
+
+
+def test_builtin_plugin_loading_retries_after_failed_import(monkeypatch):
+    from genro_routes.core import router as router_module
+
+    real_import = router_module.import_module
+
+    def failing_import(name, *args):
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    monkeypatch.setattr(router_module, "_builtins_loaded", False)
+    monkeypatch.setattr(router_module, "import_module", failing_import)
+    with pytest.raises(ModuleNotFoundError):
+        Router.available_plugins()
+    assert router_module._builtins_loaded is False
+
+    monkeypatch.setattr(router_module, "import_module", real_import)
+    assert "logging" in Router.available_plugins()
+    assert router_module._builtins_loaded is True
+
+
+def test_package_exports_resolve_lazily():
+    import genro_routes
+
+    assert genro_routes.Router is Router
+    assert "RouterNode" in dir(genro_routes)
+    assert genro_routes.__all__ == tuple(name for name, _ in genro_routes._EXPORTS)
+    with pytest.raises(AttributeError):
+        genro_routes.missing_name  # noqa: B018
+    # Submodules stay reachable as attributes of the lazy package.
+    assert genro_routes.__getattr__("exceptions") is sys.modules["genro_routes.exceptions"]
+
+    import genro_routes.core as core
+
+    assert core.Router is Router
+    assert core.route is route
+    assert "BaseRouter" in dir(core)
+    assert core.__all__ == tuple(name for name, _ in core._CORE_EXPORTS)
+    with pytest.raises(AttributeError):
+        core.missing_name  # noqa: B018
+    assert core.__getattr__("router") is sys.modules["genro_routes.core.router"]
+
+
+def test_node_resolution_is_cached_and_invalidated_on_change():
+    svc = ManualService()
+    missing = svc.route.node("late")
+    assert missing.error == "not_found"
+    assert "late" not in svc.route._node_cache  # not-found tails are not memoized
+
+    first, second = svc.route.node("auto"), svc.route.node("auto")
+    assert first is not second  # fresh RouterNode per call
+    assert first() == second() == "auto"
+    assert "auto" in svc.route._node_cache
+
+    svc.route.add_entry(svc.first, name="late")
+    assert svc.route.node("late")() == "first"
+    assert "auto" not in svc.route._node_cache
+
+
+def test_node_cache_skips_partial_args():
+    class Items(RoutingClass):
+        @route()
+        def item(self, item_id):
+            return item_id
+
+    svc = Items()
+    assert svc.route.node("item/42")() == "42"
+    assert svc.route.node("item")("7") == "7"
+    assert list(svc.route._node_cache) == ["item"]
+
+
+def test_node_cache_is_thread_safe(monkeypatch):
+    import threading
+
+    from genro_routes.core import base_router
+
+    monkeypatch.setattr(base_router, "_NODE_CACHE_SIZE", 8)
+
+    svc = ManualService()
+    for i in range(64):
+        svc.route.add_entry(svc.first, name=f"e{i}")
+    errors: list[BaseException] = []
+
+    def worker(offset):
+        try:
+            for n in range(2000):
+                assert svc.route.node(f"e{(n + offset) % 64}")() == "first"
+        except BaseException as exc:  # noqa: BLE001 - collected for the assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def test_node_cache_sees_changes_below_a_secondary_link():
+    shared = ManualService()
+    a, b = ManualService(), ManualService()
+    a.route.include(shared.route, name="primary")
+    b.route.include(shared.route, name="link")
+    assert b.route.node("link/late").error == "not_found"
+
+    shared.route.add_entry(shared.first, name="late")
+    assert b.route.node("link/late")() == "first"
+
+
+def test_node_cache_is_dropped_on_detach():
+    parent, child = ManualService(), ManualService()
+    parent.route.include(child.route, name="child")
+    assert child.route.node("x").error == "not_found"
+
+    parent.route.detach_instance(child)
+    child.route.add_entry(child.first, name="x")
+    assert child.route.node("x")() == "first"
+
+
+def test_route_manifest_is_built_once_per_class():
+    from genro_routes.core.base_router import _route_manifest
+
+    class Base(RoutingClass):
+        @route()
+        def ping(self):
+            return "pong"
+
+    class Child(Base):
+        @route()
+        def extra(self):
+            return "extra"
+
+    assert Child().route.node("ping")() == "pong"
+    manifest = _route_manifest(Child)
+    assert _route_manifest(Child) is manifest
+    assert [name for name, _, _ in manifest] == ["extra", "ping"]
+    assert [name for name, _, _ in _route_manifest(Base)] == ["ping"]
+    assert Child().route.node("extra")() == "extra"
+
+
+def test_route_manifest_ignores_routes_added_after_first_bind():
+    class Late(RoutingClass):
+        @route()
+        def ping(self):
+            return "pong"
+
+    Late().route.nodes()
+
+    def late(self):
+        return "late"
+
+    Late.late = route()(late)
+    svc = Late()
+    assert svc.route.node("late").error == "not_found"
+    svc.route.add_entry(svc.late)
+    assert svc.route.node("late")() == "late"
+
+
+def test_router_and_section_instances_have_no_dict():
+    from genro_routes import Section
+
+    svc = LoggingService()
+    assert not hasattr(svc.route, "__dict__")
+    assert not hasattr(Section(), "__dict__")
+    assert not hasattr(svc.routing, "__dict__")
+    with pytest.raises(AttributeError):
+        svc.route.unknown_attr = 1  # type: ignore[attr-defined]
+
+
+def test_router_section_and_proxy_are_weak_referenceable():
+    import weakref
+
+    from genro_routes import Section
+
+    svc = LoggingService()
+    section = Section()
+    assert weakref.ref(svc.route)() is svc.route
+    assert weakref.ref(section)() is section
+    assert weakref.ref(svc.routing)() is svc.routing
+
+
+def test_add_entry_list_and_comma_targets_bump_revision_once():
+    svc = ManualService()
+    svc.route.nodes()
+    rev = svc.route.revision
+
+    svc.route.add_entry(["first", "second"])
+    assert svc.route.revision == rev + 1
+    assert svc.route.node("first")() == "first"
+
+    svc.route.add_entry("first, second", replace=True)
+    assert svc.route.revision == rev + 2
+    assert svc.route.node("second")() == "second"
+
+
+def test_add_entry_list_targets_keep_split_options():
+    svc = ManualService()
+    svc.route.add_entry("first, second", logging_before=False, meta_tag="x")
+    for name in ("first", "second"):
+        metadata = svc.route._entries[name].metadata
+        assert metadata["plugin_config"] == {"logging": {"before": False}}
+        assert metadata["meta"] == {"tag": "x"}
+
+
+def test_method_entry_has_no_instance_dict():
+    import weakref
+
+    entry = MethodEntry(name="demo", func=lambda: None, router=None, plugins=[])
+    assert not hasattr(entry, "__dict__")
+    assert entry.handler is entry.func
+    assert weakref.ref(entry)() is entry